@@ -20,6 +20,7 @@ pipx run "typedlogic[pydantic,clingo]" --help
 ```
 
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, List, Optional
 
@@ -27,6 +28,7 @@ import click
 import typer
 from typer.main import get_command
 
+from typedlogic import Term
 from typedlogic.registry import get_compiler, get_parser, get_solver
 
 app = typer.Typer()
@@ -90,11 +92,18 @@ def convert(
         typer.echo(result)
 
 
+# file suffixes whose parser handle differs from the suffix itself
+SUFFIX_TO_FORMAT = {
+    "py": "python",
+}
+
+# data formats whose parsers can safely parse different files from several threads at once
+THREAD_SAFE_DATA_FORMATS = {"yaml"}
+
+
 def _guess_format(data_file: Path) -> str:
     suffix = data_file.suffix[1:]
-    if suffix == "py":
-        return "python"
-    return suffix
+    return SUFFIX_TO_FORMAT.get(suffix, suffix)
 
 
 @app.command()
@@ -134,10 +143,24 @@ def solve(
     if data_files:
         if theory.ground_terms is None:
             theory.ground_terms = []
-        for data_file in data_files:
-            data_parser = get_parser(data_input_format or _guess_format(data_file))
-            terms = data_parser.parse_ground_terms(data_file)
-            theory.ground_terms.extend(terms)
+        # one parser per format, shared by all data files in that format
+        data_formats = [data_input_format or _guess_format(data_file) for data_file in data_files]
+        data_parsers = {fmt: get_parser(fmt) for fmt in set(data_formats)}
+
+        def _parse_data_file(data_file: Path, fmt: str) -> List[Term]:
+            return data_parsers[fmt].parse_ground_terms(data_file)
+
+        # a file listed more than once is parsed once, and its terms are added at each position
+        data_keys = [(data_file.resolve(), fmt) for data_file, fmt in zip(data_files, data_formats, strict=True)]
+        unique_keys = list(dict.fromkeys(data_keys))
+        if len(unique_keys) > 1 and all(fmt in THREAD_SAFE_DATA_FORMATS for _, fmt in unique_keys):
+            # data files are independent, so are parsed concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_keys))) as executor:
+                parsed = dict(zip(unique_keys, executor.map(lambda k: _parse_data_file(*k), unique_keys), strict=True))
+        else:
+            parsed = {key: _parse_data_file(*key) for key in unique_keys}
+        for key in data_keys:
+            theory.ground_terms.extend(parsed[key])
 
     solver_instance.add(theory)
     solution = solver_instance.check()
@@ -18,6 +18,15 @@ class Prover9Compiler(Compiler):
         goals: Optional[List[Sentence]] = None,
         **kwargs,
     ) -> str:
+        return self.compile_assumptions(theory) + "\n" + self.compile_goals(theory, goals)
+
+    def compile_assumptions(self, theory: Theory) -> str:
+        """
+        Compile the header and assumptions (axioms) block of a theory.
+
+        :param theory:
+        :return: prover9 program fragment
+        """
         lines = [f"% Problem: {theory.name}"]
         # Assumptions (axioms)
         lines.append("formulas(assumptions).")
@@ -27,10 +36,17 @@ class Prover9Compiler(Compiler):
                     lines.append(f"    {as_prover9(sentence)}.")
         lines.append("end_of_list.")
         lines.append("")
+        return "\n".join(lines)
 
-        # Goals (conjecture)
+    def compile_goals(self, theory: Theory, goals: Optional[List[Sentence]] = None) -> str:
+        """
+        Compile the goals (conjecture) block, from the theory goals plus any additional goals.
 
-        lines.append("formulas(goals).")
+        :param theory:
+        :param goals: additional goals
+        :return: prover9 program fragment
+        """
+        lines = ["formulas(goals)."]
         for sg in theory.sentence_groups:
             if sg.group_type == SentenceGroupType.GOAL:
                 for sentence in sg.sentences or []:
@@ -3,22 +3,28 @@ Utilities for working with pandas DataFrames.
 
 TODO: Expand this further to allow DFs to be used where facts are expected.
 """
-from typing import List, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional
 
 from typedlogic import Term
 from typedlogic.extensions.probabilistic import ProbabilisticModel
 from typedlogic.solver import Model
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported on first use rather than at module level, as the registry imports
+# every module in the package on startup
 
-def as_dataframe(model: Model) -> pd.DataFrame:
+
+def as_dataframe(model: Model) -> "pd.DataFrame":
     """
     Convert a model to a pandas DataFrame.
 
     :param model:
     :return:
     """
+    import pandas as pd
+
     rows = []
     if isinstance(model, ProbabilisticModel):
         for term, prob in model.term_probabilities.items():
@@ -59,14 +65,11 @@ def dataframe_to_terms(
     :param predicate_field:
     :return:
     """
-    terms = []
-    for _, row in df.iterrows():
-        if predicate:
-            this_predicate = predicate
-            bindings = row.to_dict()
-        else:
-            this_predicate = row[predicate_field]
-            bindings = {k: v for k, v in row.items() if k != predicate_field}
-        term = Term(this_predicate, bindings)
-        terms.append(term)
-    return terms
+    # itertuples avoids constructing a Series per row, and does not upcast ints in mixed int/float frames
+    columns = list(df.columns)
+    rows = df.itertuples(index=False, name=None)
+    if predicate:
+        return [Term(predicate, dict(zip(columns, row, strict=True))) for row in rows]
+    predicate_ix = columns.index(predicate_field)
+    arg_ixs = [(i, k) for i, k in enumerate(columns) if k != predicate_field]
+    return [Term(row[predicate_ix], {k: row[i] for i, k in arg_ixs}) for row in rows]
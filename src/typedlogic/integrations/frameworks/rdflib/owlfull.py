@@ -9,7 +9,8 @@ from rdflib import OWL
 
 from typedlogic import And, Not
 from typedlogic.decorators import axiom
-from typedlogic.integrations.frameworks.rdflib.rdfs import Triple, Node, RDFS_SUBCLASS_OF, RDF_TYPE
+from typedlogic.integrations.frameworks.rdflib.rdf import Node, Triple
+from typedlogic.integrations.frameworks.rdflib.rdfs import RDF_TYPE, RDFS_SUBCLASS_OF
 
 OWL_SAME_AS = OWL.sameAs
 OWL_DIFFERENT_FROM = OWL.differentFrom
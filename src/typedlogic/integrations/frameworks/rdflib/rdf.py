@@ -1,13 +1,14 @@
 """
 Theory corresponding to RDF.
 """
+import sys
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Any, Iterator, Tuple
 
 import rdflib
 from rdflib.term import Node
 
-from typedlogic import FactMixin, axiom
+from typedlogic import FactMixin, Term, axiom
 
 
 @dataclass
@@ -53,18 +54,41 @@ def sp_iris(s: Node, p: Node, o: Node):
     :return:
     """
     if Triple(s, p, o):
-        IsIRI(p)
-    if Triple(s, p, o):
-        IsIRI(s) | IsBlank(s)
+        assert IsIRI(p) & (IsIRI(s) | IsBlank(s))
+
+
+def _store_triples(g: rdflib.Graph) -> Iterator[Tuple[Tuple[Node, Node, Node], Any]]:
+    if type(g) is rdflib.Graph:
+        # read directly from the store, skipping the generator layer of Graph.triples;
+        # other graph types (e.g. ConjunctiveGraph) have their own context semantics
+        return g.store.triples((None, None, None), context=g)
+    return ((t, None) for t in g)
 
 
 def generate_sentences(g: rdflib.Graph) -> Iterator[Triple]:
     # yield Triple(str(OWL.Thing), str(RDF.type), str(OWL.Thing))
-    for s, p, o in g:
-        if isinstance(o, rdflib.URIRef):
-            # yield Triple(str(s), str(p), str(o))
-            yield Triple(s, p, o)
-        else:
-            # TODO
-            # yield Triple(str(s), str(p), str(o))
-            yield Triple(s, p, o)
+    # TODO: decide whether literals should be materialized differently from IRIs
+    for (s, p, o), _ in _store_triples(g):
+        yield Triple(s, p, o)
+
+
+def generate_terms(g: rdflib.Graph) -> Iterator[Term]:
+    """
+    Generate ground Triple terms from a graph.
+
+    Unlike `generate_sentences`, nodes are converted to plain interned strings,
+    which hash and compare faster than rdflib nodes, and no intermediate
+    `Triple` objects are created.
+
+        >>> g = rdflib.Graph()
+        >>> EX = rdflib.Namespace("http://example.org/")
+        >>> _ = g.add((EX.Fred, EX.hasPet, EX.Fido))
+        >>> list(generate_terms(g))
+        [Triple(http://example.org/Fred, http://example.org/hasPet, http://example.org/Fido)]
+
+    :param g: rdflib Graph
+    :return: iterator over ground terms
+    """
+    predicate = Triple.__name__
+    for (s, p, o), _ in _store_triples(g):
+        yield Term(predicate, sys.intern(str(s)), sys.intern(str(p)), sys.intern(str(o)))
@@ -3,7 +3,7 @@ from typing import TextIO, Union
 
 from rdflib import Graph
 
-from typedlogic import Theory, Term
+from typedlogic import Theory
 from typedlogic.integrations.frameworks.rdflib import rdf, rdfs
 from typedlogic.parser import Parser
 from typedlogic.parsers.pyparser import PythonParser
@@ -41,9 +41,9 @@ class RDFParser(Parser):
         >>> facts = [fact.as_sexpr() for fact in theory.ground_terms]
         >>> for fact in sorted(facts):
         ...     print(fact)
-        ['Triple', rdflib.term.URIRef('http://example.org/Fred'), rdflib.term.URIRef('http://example.org/hasPet'), rdflib.term.URIRef('http://example.org/Fido')]
-        ['Triple', rdflib.term.URIRef('http://example.org/hasPet'), rdflib.term.URIRef('http://www.w3.org/2000/01/rdf-schema#domain'), rdflib.term.URIRef('http://example.org/Human')]
-        ['Triple', rdflib.term.URIRef('http://example.org/hasPet'), rdflib.term.URIRef('http://www.w3.org/2000/01/rdf-schema#range'), rdflib.term.URIRef('http://example.org/Animal')]
+        ['Triple', 'http://example.org/Fred', 'http://example.org/hasPet', 'http://example.org/Fido']
+        ['Triple', 'http://example.org/hasPet', 'http://www.w3.org/2000/01/rdf-schema#domain', 'http://example.org/Human']
+        ['Triple', 'http://example.org/hasPet', 'http://www.w3.org/2000/01/rdf-schema#range', 'http://example.org/Animal']
 
     After this other facts can be inferred using a solver.
 
@@ -76,9 +76,9 @@ class RDFParser(Parser):
             g.parse(source, format=format)
         parser = PythonParser()
         theory = parser.transform(rdfs)
-        for sentence in rdf.generate_sentences(g):
-            t = sentence.to_model_object()
-            if not isinstance(t, Term):
-                raise ValueError(f"expected term: {t}")
-            theory.ground_terms.append(t)
+        if not rdfs.FULL_FOL_MODE:
+            theory.sentence_groups = [
+                sg for sg in theory.sentence_groups if sg.name != rdfs.triples_from_classification.__name__
+            ]
+        theory.ground_terms.extend(rdf.generate_terms(g))
         return theory
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 
 from rdflib import RDF, RDFS
 
-from typedlogic import FactMixin, Iff
+from typedlogic import FactMixin
 from typedlogic.decorators import axiom
 from typedlogic.integrations.frameworks.rdflib.rdf import Node, Triple
 
@@ -14,6 +14,10 @@ RDF_TYPE = RDF.type
 RDFS_DOMAIN = RDFS.domain
 RDFS_RANGE = RDFS.range
 
+# If True, the RDFParser includes the `triples_from_classification` axioms,
+# at the cost of extra rule firings in datalog engines
+FULL_FOL_MODE = False
+
 
 @dataclass
 class OWLClass(FactMixin):
@@ -130,7 +134,45 @@ def domain_and_range(s: Node, p: Node, o: Node, c: Node):
 
 @axiom
 def classification_of_triples(s: Node, p: Node, o: Node):
-    assert Iff((Triple(s, p, o) and (p == RDFS_SUBCLASS_OF)), SubClassOf(s, o))
-    assert Iff((Triple(s, p, o) and (p == RDF_TYPE)), Type(s, o))
-    assert Iff((Triple(s, p, o) and (p == RDFS_DOMAIN)), Domain(s, o))
-    assert Iff((Triple(s, p, o) and (p == RDFS_RANGE)), Range(s, o))
+    """
+    Classification of triples into RDFS predicates.
+
+    These are forward (Horn) rules, which is all that is needed for forward-chaining
+    datalog engines. The reverse direction is in `triples_from_classification`.
+
+    :param s: subject
+    :param p: predicate
+    :param o: object
+    :return:
+    """
+    if Triple(s, p, o) and (p == RDFS_SUBCLASS_OF):
+        assert SubClassOf(s, o)
+    if Triple(s, p, o) and (p == RDF_TYPE):
+        assert Type(s, o)
+    if Triple(s, p, o) and (p == RDFS_DOMAIN):
+        assert Domain(s, o)
+    if Triple(s, p, o) and (p == RDFS_RANGE):
+        assert Range(s, o)
+
+
+@axiom
+def triples_from_classification(s: Node, o: Node):
+    """
+    Materialization of triples from RDFS predicates.
+
+    Together with `classification_of_triples`, this makes each RDFS predicate
+    equivalent to the corresponding triple. This is only included by the `RDFParser`
+    if `FULL_FOL_MODE` is set.
+
+    :param s: subject
+    :param o: object
+    :return:
+    """
+    if SubClassOf(s, o):
+        assert Triple(s, RDFS_SUBCLASS_OF, o)
+    if Type(s, o):
+        assert Triple(s, RDF_TYPE, o)
+    if Domain(s, o):
+        assert Triple(s, RDFS_DOMAIN, o)
+    if Range(s, o):
+        assert Triple(s, RDFS_RANGE, o)
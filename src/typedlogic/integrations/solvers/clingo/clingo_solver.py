@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Iterator, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple
 
 import clingo
 from clingo import Control, SymbolType
@@ -64,6 +64,10 @@ class ClingoSolver(Solver):
     profile: ClassVar[Profile] = MixedProfile(AnswerSetProgramming(), AllowsComparisonTerms(), MultipleModelSemantics())
     ctl: Optional[Control] = None
 
+    _prolog_cache: Dict[Tuple[int, str], Tuple[Sentence, List[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def _clauses(self) -> Iterator[str]:
         negation_symbol = "not" if self.assume_closed_world else "-"
         prolog_config = PrologConfig(
@@ -76,18 +80,26 @@ class ClingoSolver(Solver):
         for sentence in self.base_theory.sentences + self.base_theory.ground_terms:
             if not isinstance(sentence, Sentence):
                 raise ValueError(f"Expected Sentence, got {sentence}")
-            rules = []
+            # the cache entry holds a reference to the sentence, so its id cannot be reused
+            key = (id(sentence), negation_symbol)
+            cached = self._prolog_cache.get(key)
+            if cached is None:
+                cached = (sentence, list(self._sentence_clauses(sentence, prolog_config)))
+                self._prolog_cache[key] = cached
+            yield from cached[1]
+
+    def _sentence_clauses(self, sentence: Sentence, prolog_config: PrologConfig) -> Iterator[str]:
+        rules = []
+        try:
+            for rule in to_horn_rules(sentence, allow_disjunctions_in_head=True, allow_goal_clauses=True):
+                rules.append(rule)
+        except NotInProfileError as e:
+            logger.info(f"Skipping sentence {sentence} due to {e}")
+        for rule in rules:
             try:
-                for rule in to_horn_rules(sentence, allow_disjunctions_in_head=True, allow_goal_clauses=True):
-                    rules.append(rule)
-                    # yield as_prolog(rule, config=prolog_config)
+                yield as_prolog(rule, config=prolog_config)
             except NotInProfileError as e:
                 logger.info(f"Skipping sentence {sentence} due to {e}")
-            for rule in rules:
-                try:
-                    yield as_prolog(rule, config=prolog_config)
-                except NotInProfileError as e:
-                    logger.info(f"Skipping sentence {sentence} due to {e}")
 
     def models(self) -> Iterator[Model]:
         ctl = Control(["0"])
@@ -1,3 +1,4 @@
+import json
 import logging
 from dataclasses import dataclass, field
 from typing import Any, ClassVar, Iterable, Iterator, List, Optional, Tuple
@@ -17,14 +18,13 @@ Your task is to determine whether logical statements follow from a given set of
 I will provide you with an initial list of axioms. I will then give a numbered set of
 sentences. You will return whether that sentence follows from the axioms.
 
-Give results as a simple yaml object like this:
+Give results as a simple json object like this:
 
-```yaml
-provable: [1, 3, 5]
-not_provable: [2, 4, 6]
+```json
+{"provable": [1, 3, 5], "not_provable": [2, 4, 6]}
 ```
 
-Do not provide proofs, just the yaml object.
+Do not provide proofs, just the json object.
 """
 
 TEMPLATE = """
@@ -104,11 +104,30 @@ class LLMSolver(Solver):
             yield enumerated_goals[int(i)], False
 
     def parse_response(self, text: str) -> Any:
+        """
+        Parse the LLM response into a dictionary.
+
+        The prompt requests json, which is parsed directly; yaml is used as a fallback
+        for models that ignore the requested format.
+
+            >>> LLMSolver().parse_response('{"provable": [1], "not_provable": [2]}')
+            {'provable': [1], 'not_provable': [2]}
+            >>> LLMSolver().parse_response('provable: [1]')
+            {'provable': [1]}
+
+        :param text: raw response text
+        :return: parsed object
+        """
         if "```" in text:
             text = text.split("```")[1].strip()
-            if text.startswith("yaml"):
-                text = text[5:].strip()
-        return yaml.safe_load(text)
+            for lang in ("json", "yaml"):
+                if text.startswith(lang):
+                    text = text[len(lang) :].strip()
+                    break
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return yaml.safe_load(text)
 
     def check(self) -> Solution:
         return Solution(satisfiable=None)
@@ -1,5 +1,5 @@
 import logging
-from typing import ClassVar, Optional, Union, List, Tuple, Dict, Any
+from typing import ClassVar, Optional, Union, List, Tuple, Dict, Any, Iterator
 
 import problog.logic as pl
 
@@ -12,12 +12,49 @@ from typedlogic.transformations import (
     as_prolog,
     to_horn_rules,
 )
+from typedlogic.utils.identity_cache import IdentityCache
 
 logger = logging.getLogger(__name__)
 
 PROBABILITY_PREDICATE = "Probability"
 THAT_PREDICATE = "That"
 
+DEFAULT_PROLOG_CONFIG = PrologConfig(disjunctive_datalog=True, double_quote_strings=True, allow_nesting=False)
+
+# rules rendered with DEFAULT_PROLOG_CONFIG, keyed on rule identity
+_rule_cache: IdentityCache[str] = IdentityCache()
+
+
+def _rule_as_prolog(rule: Sentence, prolog_config: PrologConfig, strict=True) -> str:
+    if prolog_config is not DEFAULT_PROLOG_CONFIG:
+        return as_prolog(rule, config=prolog_config, strict=strict)
+    prolog = _rule_cache.get(rule)
+    if prolog is None:
+        try:
+            prolog = as_prolog(rule, config=prolog_config)
+        except NotInProfileError:
+            if strict:
+                raise
+            return ""
+        _rule_cache.set(rule, prolog)
+    return prolog
+
+
+# horn rules for each sentence, keyed on sentence identity; an empty tuple records a sentence that is skipped
+_horn_rule_cache: IdentityCache[Tuple[Sentence, ...]] = IdentityCache()
+
+
+def _horn_rules(sentence: Sentence) -> Tuple[Sentence, ...]:
+    rules = _horn_rule_cache.get(sentence)
+    if rules is None:
+        try:
+            rules = tuple(to_horn_rules(sentence, allow_disjunctions_in_head=True, allow_goal_clauses=True))
+        except NotInProfileError as e:
+            logger.info(f"Skipping sentence {sentence} due to {e}")
+            rules = ()
+        _horn_rule_cache.set(sentence, rules)
+    return rules
+
 
 class ProbLogCompiler(Compiler):
     default_suffix: ClassVar[str] = "problog"
@@ -54,60 +91,33 @@ class ProbLogCompiler(Compiler):
         :param kwargs:
         :return:
         """
-        prolog_config = PrologConfig(disjunctive_datalog=True, double_quote_strings=True, allow_nesting=False)
+        prolog_config = DEFAULT_PROLOG_CONFIG
         if not self._predicate_mappings:
             self._predicate_mappings = {}
-        for pd in theory.predicate_definitions:
-            prolog_pd = as_prolog(Term(pd.predicate), config=prolog_config)
-            if "(" in prolog_pd:
-                prolog_pd = prolog_pd[: prolog_pd.index("(")]
-            self._predicate_mappings[prolog_pd] = pd.predicate
-        clauses = []
+        self._predicate_mappings.update(
+            {
+                as_prolog(Term(pd.predicate), config=prolog_config).partition("(")[0]: pd.predicate
+                for pd in theory.predicate_definitions
+            }
+        )
+        clauses: List[str] = []
         for sentence in theory.sentences + theory.ground_terms:
-            clause = self._sentence_to_problog(sentence, prolog_config)
-            if clause:
-                clauses.append(clause)
+            clauses.extend(self._sentence_to_problog(sentence, prolog_config))
         for pd in theory.predicate_definitions:
             if pd.predicate in [Probability.__name__, That.__name__, Evidence.__name__]:
                 continue
             query_vars = [Variable(a) for a in pd.arguments.keys()]
             term = Term("query", Term(pd.predicate, *query_vars))
-            clause = self._sentence_to_problog(term, prolog_config)
-            clauses.append(clause)
+            clauses.extend(self._sentence_to_problog(term, prolog_config))
         return "\n".join(clauses)
 
-    def _sentence_to_problog(self, sentence: Sentence, prolog_config: PrologConfig) -> str:
-        if isinstance(sentence, Forall):
-            if isinstance(sentence.sentence, Term):
-                if sentence.sentence.predicate == "eq":
-                    vals = sentence.sentence.values
-                    if len(vals) != 2:
-                        raise ValueError(f"Invalid equality sentence: {sentence}")
-                    first = vals[0]
-                    if isinstance(first, Term) and first.predicate == "probability":
-                        inner_expr = first.values[0]
-                        pr = vals[1]
-                        return self._sentence_to_problog(
-                            Term(Probability.__name__, pr, That(inner_expr).to_model_object()), prolog_config
-                        )
-
-        def _to_rules(s: Sentence) -> List[Sentence]:
-            rules = []
-            try:
-                for rule in to_horn_rules(s, allow_disjunctions_in_head=True, allow_goal_clauses=True):
-                    rules.append(rule)
-            except NotInProfileError as e:
-                logger.info(f"Skipping sentence {s} due to {e}")
-            return rules
-
+    def _sentence_to_problog(self, sentence: Sentence, prolog_config: PrologConfig) -> Iterator[str]:
         pr_sent = self._sentence_probability(sentence)
         if pr_sent:
             pr, inner = pr_sent
-            inner_rules = _to_rules(inner)
-            strs = []
-            for r in inner_rules:
-                strs.append(f"{pr}::{as_prolog(r, config=prolog_config)}")
-            return "\n".join(strs)
+            prefix = f"{pr}::"
+            for r in _horn_rules(inner):
+                yield prefix + _rule_as_prolog(r, prolog_config)
         elif isinstance(sentence, Term) and sentence.predicate == Evidence.__name__:
             if len(sentence.values) != 2:
                 raise ValueError(f"Invalid evidence sentence: {sentence}")
@@ -116,35 +126,69 @@ class ProbLogCompiler(Compiler):
             if not inner_prolog:
                 raise ValueError(f"Invalid evidence inner sentence: {inner}")
             truth_value = sentence.values[1]
-            return f"evidence({inner_prolog}, {'true' if truth_value else 'false'})."
+            yield f"evidence({inner_prolog}, {'true' if truth_value else 'false'})."
         else:
-            rules = _to_rules(sentence)
-            return "\n".join([as_prolog(r, config=prolog_config, strict=False) for r in rules])
+            for r in _horn_rules(sentence):
+                clause = _rule_as_prolog(r, prolog_config, strict=False)
+                if clause:
+                    yield clause
 
     def _sentence_probability(self, sentence: Sentence) -> Optional[Tuple[Union[float, int], Sentence]]:
-        if isinstance(sentence, Forall):
-            return self._sentence_probability(sentence.sentence)
-        if isinstance(sentence, Term):
-            if sentence.predicate == PROBABILITY_PREDICATE:
-                if len(sentence.values) != 2:
-                    raise ValueError(f"Invalid probability sentence: {sentence}")
-                pr = sentence.values[0]
-                inner = sentence.values[1]
-                if not isinstance(pr, (float, int)):
-                    raise ValueError(f"Invalid probability: {pr}")
-                if not isinstance(inner, Sentence):
-                    raise ValueError(f"Invalid inner sentence: {inner}")
-                if isinstance(inner, Extension):
-                    inner = inner.to_model_object()
-                if not isinstance(inner, Term):
-                    raise ValueError(f"Invalid inner term: {inner}")
-                if inner.predicate != THAT_PREDICATE:
-                    raise ValueError(f"Invalid inner predicate: {inner.predicate}")
-                inner_ref = inner.values[0]
-                if not isinstance(inner_ref, Sentence):
-                    raise ValueError(f"Invalid inner reference: {inner_ref}")
-                return pr, inner_ref
-        return None
+        """
+        Extract the probability and the inner sentence from a probability sentence.
+
+        Both `Probability(pr, That(s))` and quantified `probability(s) == pr` forms are recognized:
+
+            >>> compiler = ProbLogCompiler()
+            >>> compiler._sentence_probability(Probability(0.5, That(Term("P", "a"))).to_model_object())
+            (0.5, P(a))
+            >>> x = Variable("x")
+            >>> compiler._sentence_probability(Forall([x], Term("eq", Term("probability", Term("P", x)), 0.5)))
+            (0.5, P(?x))
+            >>> compiler._sentence_probability(Term("P", "a")) is None
+            True
+
+        :param sentence:
+        :return: tuple of probability and inner sentence, or None if not a probability sentence
+        """
+        if type(sentence) is Term and sentence.predicate != PROBABILITY_PREDICATE:
+            # fast path for ground terms, which make up the bulk of most theories
+            return None
+        quantified = type(sentence) is Forall
+        while type(sentence) is Forall:
+            sentence = sentence.sentence
+        if not isinstance(sentence, Term):
+            return None
+        if quantified and sentence.predicate == "eq":
+            vals = sentence.values
+            if len(vals) != 2:
+                raise ValueError(f"Invalid equality sentence: {sentence}")
+            first = vals[0]
+            if not (isinstance(first, Term) and first.predicate == "probability"):
+                return None
+            pr = vals[1]
+            inner_ref = first.values[0]
+        elif sentence.predicate == PROBABILITY_PREDICATE:
+            if len(sentence.values) != 2:
+                raise ValueError(f"Invalid probability sentence: {sentence}")
+            pr = sentence.values[0]
+            inner = sentence.values[1]
+            if not isinstance(inner, Sentence):
+                raise ValueError(f"Invalid inner sentence: {inner}")
+            if isinstance(inner, Extension):
+                inner = inner.to_model_object()
+            if not isinstance(inner, Term):
+                raise ValueError(f"Invalid inner term: {inner}")
+            if inner.predicate != THAT_PREDICATE:
+                raise ValueError(f"Invalid inner predicate: {inner.predicate}")
+            inner_ref = inner.values[0]
+        else:
+            return None
+        if not isinstance(pr, (float, int)):
+            raise ValueError(f"Invalid probability: {pr}")
+        if not isinstance(inner_ref, Sentence):
+            raise ValueError(f"Invalid inner reference: {inner_ref}")
+        return pr, inner_ref
 
     def decompile_term(self, compiled_term: Any) -> Term:
         if isinstance(compiled_term, pl.Term):
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import ClassVar, Iterator
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
 
 from problog import get_evaluatable
 from problog.program import PrologString
@@ -19,6 +19,9 @@ from typedlogic.solver import Solution, Solver
 
 logger = logging.getLogger(__name__)
 
+# the default (knowledge compilation) evaluatable; selecting it does not depend on the program
+EVALUATABLE = get_evaluatable()
+
 
 @dataclass
 class ProbLogSolver(Solver):
@@ -50,12 +53,46 @@ class ProbLogSolver(Solver):
     exec_name: str = field(default="problog")
     profile: ClassVar[Profile] = MixedProfile(Probabilistic(), AllowsComparisonTerms(), MultipleModelSemantics())
 
-    def models(self) -> Iterator[ProbabilisticModel]:
+    _compiled: Optional[Tuple[Tuple[Tuple[Any, ...], ...], ProbLogCompiler, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _evaluated: Optional[Tuple[str, Dict[Any, float]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _compile(self) -> Tuple[ProbLogCompiler, str]:
+        """
+        Compile the base theory to a ProbLog program.
+
+        The result is reused as long as the theory has the same predicate definitions,
+        sentences, and ground terms (compared by identity), so repeated calls to
+        `models`, `check`, and `dump` on an unchanged theory only compile once.
+
+        :return: the compiler (which holds the predicate mappings) and the program
+        """
+        theory = self.base_theory
+        fingerprint = (
+            tuple(theory.predicate_definitions),
+            tuple(theory.sentences),
+            tuple(theory.ground_terms),
+        )
+        if self._compiled is not None:
+            cached_fingerprint, compiler, program = self._compiled
+            if all(
+                len(a) == len(b) and all(x is y for x, y in zip(a, b, strict=True))
+                for a, b in zip(fingerprint, cached_fingerprint, strict=True)
+            ):
+                return compiler, program
         compiler = ProbLogCompiler()
-        program = compiler.compile(self.base_theory)
-        p = PrologString(program)
-        ev = get_evaluatable()
-        result = ev.create_from(p).evaluate()
+        program = compiler.compile(theory)
+        self._compiled = (fingerprint, compiler, program)
+        return compiler, program
+
+    def models(self) -> Iterator[ProbabilisticModel]:
+        compiler, program = self._compile()
+        if self._evaluated is not None and self._evaluated[0] is program:
+            result = self._evaluated[1]
+        else:
+            result = EVALUATABLE.create_from(PrologString(program)).evaluate()
+            self._evaluated = (program, result)
         m = ProbabilisticModel()
         for term, prob in result.items():
             plt_term = compiler.decompile_term(term)
@@ -81,8 +118,8 @@ class ProbLogSolver(Solver):
         return Solution(satisfiable=sat)
 
     def dump(self) -> str:
-        compiler = ProbLogCompiler()
-        return compiler.compile(self.base_theory)
+        _, program = self._compile()
+        return program
 
     def add_probabilistic_fact(self, fact: Sentence, probability: float) -> None:
         pr_sent = Probability(probability, That(fact))
@@ -1,8 +1,9 @@
 import logging
+import os
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import ClassVar, Iterator, List, Optional
+from typing import Any, ClassVar, Iterable, Iterator, List, Optional, Tuple
 
 from typedlogic import Sentence
 from typedlogic.compilers.prover9_compiler import Prover9Compiler
@@ -43,6 +44,10 @@ class Prover9Solver(Solver):
     exec_name: str = field(default="prover9")
     profile: ClassVar[Profile] = MixedProfile(Unrestricted(), OpenWorld())
 
+    _compiled_assumptions: Optional[Tuple[Optional[str], Tuple[Tuple[Any, ...], ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def models(self) -> Iterator[Model]:
         r = self.check()
         if r.satisfiable:
@@ -52,25 +57,67 @@ class Prover9Solver(Solver):
         proved = self._run(goals=[sentence])
         return proved
 
+    def prove_multiple(self, sentences: List[Sentence]) -> Iterable[Tuple[Sentence, Optional[bool]]]:
+        """
+        Prove multiple sentences.
+
+        Each goal is independent, so one prover9 process is run per goal, in parallel.
+        All programs are compiled up front, sharing one compilation of the assumptions,
+        so worker threads only run prover9.
+
+        :param sentences:
+        :return: iterable of (sentence, provable) tuples, in the order given
+        """
+        if self.check().satisfiable is False:
+            raise ValueError("Cannot prove goals for unsatisfiable theory")
+        if not sentences:
+            raise ValueError("No goals to prove")
+        compiler = Prover9Compiler()
+        assumptions = self._compile_assumptions(compiler)
+        programs = [assumptions + "\n" + compiler.compile_goals(self.base_theory, [s]) for s in sentences]
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 2, len(programs))) as executor:
+            results = list(executor.map(self._run_program, programs))
+        yield from zip(sentences, results, strict=True)
+
     def _run(self, goals: Optional[List[Sentence]] = None) -> bool:
         compiler = Prover9Compiler()
         # print(f"THEORY; n_sentences: {len(self.base_theory.sentences)}")
-        program = compiler.compile(self.base_theory, goals=goals)
+        program = self._compile_assumptions(compiler) + "\n" + compiler.compile_goals(self.base_theory, goals)
 
         # print(program)
-
-        with tempfile.NamedTemporaryFile(suffix=".prover9", mode="w") as fp:
-            fp.write(program)
-            fp.flush()
-            res = subprocess.run([self.exec_name, "-f", fp.name], capture_output=True)
-            if res.returncode not in (0, 2):
-                logger.error(res.stdout.decode())
-                raise ValueError(f"Prover9 failed with return code {res.returncode}")
-
-            if "THEOREM PROVED" in res.stdout.decode():
-                return True
-            else:
-                return False
+        return self._run_program(program)
+
+    def _run_program(self, program: str) -> bool:
+        # prover9 reads its input from stdin when no file is given
+        res = subprocess.run([self.exec_name], input=program.encode(), capture_output=True)
+        if res.returncode not in (0, 2):
+            logger.error(res.stdout.decode())
+            raise ValueError(f"Prover9 failed with return code {res.returncode}")
+
+        return b"THEOREM PROVED" in res.stdout
+
+    def _compile_assumptions(self, compiler: Prover9Compiler) -> str:
+        """
+        Compile the assumptions of the base theory, reusing the previous result if unchanged.
+
+        The theory is considered unchanged if it has the same name and sentence groups,
+        and the same sentences (compared by identity).
+
+        :param compiler:
+        :return: prover9 program fragment
+        """
+        theory = self.base_theory
+        fingerprint = (tuple(theory.sentence_groups), tuple(theory.sentences))
+        if self._compiled_assumptions is not None:
+            name, cached_fingerprint, program = self._compiled_assumptions
+            if name == theory.name and all(
+                len(a) == len(b) and all(x is y for x, y in zip(a, b, strict=True))
+                for a, b in zip(fingerprint, cached_fingerprint, strict=True)
+            ):
+                return program
+        program = compiler.compile_assumptions(theory)
+        self._compiled_assumptions = (theory.name, fingerprint, program)
+        return program
 
     def check(self) -> Solution:
         proved = self._run()
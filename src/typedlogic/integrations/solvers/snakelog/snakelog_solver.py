@@ -1,7 +1,8 @@
 import logging
 import sqlite3
 from dataclasses import dataclass, field
-from typing import ClassVar, Dict, Iterator, List, Optional, Union
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, Iterator, List, Optional, Union
 
 import snakelog.common as snakelog
 import snakelog.litelog as litelog
@@ -29,12 +30,19 @@ from typedlogic.profiles import (
 from typedlogic.pybridge import fact_arg_values, fact_predicate
 from typedlogic.solver import Method, Model, Solution, Solver
 from typedlogic.transformations import to_horn_rules
+from typedlogic.utils.type_dispatch import lookup_handler
 
 logger = logging.getLogger(__name__)
 
 PRIMITIVE_TYPES = (int, float, str, bool, bytes)
 
 
+@lru_cache(maxsize=1024)
+def _var(name: str) -> Var:
+    # Var is frozen, so instances can be shared between atoms
+    return Var(name.upper())
+
+
 @dataclass
 class SnakeLogSolver(Solver):
     """
@@ -88,6 +96,7 @@ class SnakeLogSolver(Solver):
     _wrapped_solver: Optional[snakelog.BaseSolver] = None
     predicate_map: Optional[Dict[str, PredicateDefinition]] = None
     sentences: List[Sentence] = field(default_factory=list)
+    _pred_name_cache: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     profile: ClassVar[Profile] = MixedProfile(ClassicDatalog(), UnsortedLogic(), ExcludedProfile(PropositionalLogic()))
 
@@ -117,12 +126,11 @@ class SnakeLogSolver(Solver):
             raise ValueError("Predicates have not been defined")
         for p, pd in self.predicate_map.items():
             tbl = self.to_predicate(p)
+            arg_keys = tuple(pd.arguments.keys())
             try:
                 res = s.con.execute(f"SELECT * FROM {tbl}")
-                for fact in res.fetchall():
-                    bindings = dict(zip(pd.arguments.keys(), fact[0:], strict=False))
-                    fact = Term(p, bindings)
-                    facts.append(fact)
+                for row in res:
+                    facts.append(Term(p, dict(zip(arg_keys, row, strict=False))))
             except sqlite3.OperationalError:
                 # TODO: better way to detect zero implications
                 pass
@@ -139,6 +147,8 @@ class SnakeLogSolver(Solver):
         self.sentences.append(fact)
 
     def add_sentence(self, sentence: Sentence) -> None:
+        # clauses are passed to the wrapped solver eagerly, so that NotInProfileError surfaces here;
+        # both backends only record clauses on add, and defer all compilation to run()
         try:
             for sentence in to_horn_rules(sentence):
                 for snakelog_expr in self.to_clauses(sentence):
@@ -162,78 +172,120 @@ class SnakeLogSolver(Solver):
         s = self.wrapped_solver
         string_type = self._string_type()
         arg_types = [string_type for _ in predicate_definition.arguments.keys()]
+        self._pred_name_cache[predicate_definition.predicate] = predicate_definition.predicate.lower()
         sig = [self.to_predicate(predicate_definition.predicate)] + arg_types
         s.Relation(*sig)
         self.predicate_map[predicate_definition.predicate] = predicate_definition
 
     def to_predicate(self, predicate: str) -> str:
-        return predicate.lower()
+        name = self._pred_name_cache.get(predicate)
+        if name is None:
+            name = predicate.lower()
+        return name
 
     def to_clauses(self, sentence: Sentence) -> List[Union[litelog.Clause, litelog.Atom]]:
-        if isinstance(sentence, tlog.Forall):
-            return self.to_clauses(sentence.sentence)
-        if isinstance(sentence, tlog.Implied):
-            return self.to_clauses(tlog.Implies(sentence.operands[1], sentence.operands[0]))
-        if isinstance(sentence, tlog.Iff):
-            return self.to_clauses(
-                tlog.And(tlog.Implies(sentence.left, sentence.right), tlog.Implies(sentence.right, sentence.left))
-            )
-        if isinstance(sentence, tlog.And):
-            sentences = []
-            for s in sentence.operands:
-                sentences.extend(self.to_clauses(s))
-            return sentences
+        handler = lookup_handler(self._CLAUSES_DISPATCH, type(sentence))
+        if handler is not None:
+            return handler(self, sentence)
         return [self.to_clause(sentence)]
 
+    def _forall_to_clauses(self, sentence: tlog.Forall) -> List[Union[litelog.Clause, litelog.Atom]]:
+        return self.to_clauses(sentence.sentence)
+
+    def _implied_to_clauses(self, sentence: tlog.Implied) -> List[Union[litelog.Clause, litelog.Atom]]:
+        return self.to_clauses(tlog.Implies(sentence.operands[1], sentence.operands[0]))
+
+    def _iff_to_clauses(self, sentence: tlog.Iff) -> List[Union[litelog.Clause, litelog.Atom]]:
+        return self.to_clauses(
+            tlog.And(tlog.Implies(sentence.left, sentence.right), tlog.Implies(sentence.right, sentence.left))
+        )
+
+    def _and_to_clauses(self, sentence: tlog.And) -> List[Union[litelog.Clause, litelog.Atom]]:
+        sentences = []
+        for s in sentence.operands:
+            sentences.extend(self.to_clauses(s))
+        return sentences
+
     def to_clause(self, sentence: Sentence) -> Union[litelog.Clause, litelog.Atom]:
-        if isinstance(sentence, tlog.Forall):
-            return self.to_clause(sentence.sentence)
-        if isinstance(sentence, tlog.Implies):
-            head = self.to_atom(sentence.consequent)
-            body = self.to_body(sentence.antecedent)
-            return litelog.Clause(head, body)
-        if isinstance(sentence, tlog.Term):
-            # unit clause
-            return self.to_atom(sentence)
+        handler = lookup_handler(self._CLAUSE_DISPATCH, type(sentence))
+        if handler is not None:
+            return handler(self, sentence)
         raise NotInProfileError(f"Unknown clause type {type(sentence)} :: {sentence}")
 
+    def _forall_to_clause(self, sentence: tlog.Forall) -> Union[litelog.Clause, litelog.Atom]:
+        return self.to_clause(sentence.sentence)
+
+    def _implies_to_clause(self, sentence: tlog.Implies) -> litelog.Clause:
+        head = self.to_atom(sentence.consequent)
+        body = self.to_body(sentence.antecedent)
+        return litelog.Clause(head, body)
+
     def to_atom(self, sentence: Sentence) -> litelog.Atom:
-        if isinstance(sentence, tlog.Term):
-
-            def _render_arg(arg):
-                if arg is None:
-                    return None
-                if isinstance(arg, tlog.Variable):
-                    # TODO: this should be the norm after normalization
-                    arg = arg.name
-                    return Var(arg.upper())
-                else:
-                    if isinstance(arg, PRIMITIVE_TYPES):
-                        return arg
-                    else:
-                        return str(arg)
-
-            return litelog.Atom(
-                self.to_predicate(sentence.predicate), [_render_arg(a) for a in sentence.bindings.values()]
-            )
-        if isinstance(sentence, typedlogic.pybridge.FactMixin):
-
-            def _render_arg(arg):
-                if arg is None:
-                    return None
-                return Var(arg.upper())
-
-            p = self.to_predicate(fact_predicate(sentence))
-            return litelog.Atom(p, [_render_arg(a) for a in fact_arg_values(sentence)])
+        handler = lookup_handler(self._ATOM_DISPATCH, type(sentence))
+        if handler is not None:
+            return handler(self, sentence)
         raise NotInProfileError(f"Unknown atom type {type(sentence)} :: {sentence}")
 
+    def _term_to_atom(self, sentence: Term) -> litelog.Atom:
+        def _render_arg(arg):
+            if arg is None:
+                return None
+            if isinstance(arg, tlog.Variable):
+                # TODO: this should be the norm after normalization
+                arg = arg.name
+                return _var(arg)
+            else:
+                if isinstance(arg, PRIMITIVE_TYPES):
+                    return arg
+                else:
+                    return str(arg)
+
+        return litelog.Atom(self.to_predicate(sentence.predicate), [_render_arg(a) for a in sentence.bindings.values()])
+
+    def _fact_to_atom(self, sentence: FactMixin) -> litelog.Atom:
+        def _render_arg(arg):
+            if arg is None:
+                return None
+            return _var(arg)
+
+        p = self.to_predicate(fact_predicate(sentence))
+        return litelog.Atom(p, [_render_arg(a) for a in fact_arg_values(sentence)])
+
     def to_body(self, sentence: Sentence) -> litelog.Body:
-        if isinstance(sentence, tlog.And):
-            atoms = [self.to_atom(s) for s in sentence.operands]
-            return litelog.Body(atoms)
-        if isinstance(sentence, (tlog.Term, typedlogic.pybridge.FactMixin)):
-            return litelog.Body([self.to_atom(sentence)])
+        handler = lookup_handler(self._BODY_DISPATCH, type(sentence))
+        if handler is not None:
+            return handler(self, sentence)
         raise NotInProfileError(f"Unknown body type {type(sentence)} :: {sentence}")
 
+    def _and_to_body(self, sentence: tlog.And) -> litelog.Body:
+        atoms = [self.to_atom(s) for s in sentence.operands]
+        return litelog.Body(atoms)
+
+    def _atom_to_body(self, sentence: Sentence) -> litelog.Body:
+        return litelog.Body([self.to_atom(sentence)])
+
+    # dispatch tables, keyed on sentence type; see lookup_handler
+    _CLAUSES_DISPATCH: ClassVar[Dict[type, Optional[Callable]]] = {
+        tlog.Forall: _forall_to_clauses,
+        tlog.Implied: _implied_to_clauses,
+        tlog.Iff: _iff_to_clauses,
+        tlog.And: _and_to_clauses,
+    }
+    _CLAUSE_DISPATCH: ClassVar[Dict[type, Optional[Callable]]] = {
+        tlog.Forall: _forall_to_clause,
+        tlog.Implies: _implies_to_clause,
+        # unit clause
+        tlog.Term: _term_to_atom,
+    }
+    _ATOM_DISPATCH: ClassVar[Dict[type, Optional[Callable]]] = {
+        tlog.Term: _term_to_atom,
+        typedlogic.pybridge.FactMixin: _fact_to_atom,
+    }
+    _BODY_DISPATCH: ClassVar[Dict[type, Optional[Callable]]] = {
+        tlog.And: _and_to_body,
+        tlog.Term: _atom_to_body,
+        typedlogic.pybridge.FactMixin: _atom_to_body,
+    }
+
     def dump(self) -> str:
         return str(self.wrapped_solver)
@@ -1,8 +1,9 @@
-from typing import ClassVar, Optional, Union
+import io
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from typedlogic import Theory
 from typedlogic.compiler import Compiler, ModelSyntax
-from typedlogic.datamodel import NotInProfileError
+from typedlogic.datamodel import NotInProfileError, Sentence
 from typedlogic.transformations import (
     PrologConfig,
     as_prolog,
@@ -10,6 +11,49 @@ from typedlogic.transformations import (
     replace_constants,
     to_horn_rules,
 )
+from typedlogic.utils.identity_cache import IdentityCache
+
+PROLOG_CONFIG = PrologConfig(
+    use_lowercase_vars=True,
+    use_uppercase_predicates=None,
+    negation_symbol="!",
+    double_quote_strings=True,
+    operator_map={
+        "eq": "=",
+    },
+    include_parens_for_zero_args=True,
+)
+
+# rendered rules, keyed on rule identity; PROLOG_CONFIG is fixed, so is not part of the key
+_rule_cache: IdentityCache[str] = IdentityCache()
+
+
+def _rule_as_prolog(rule: Sentence) -> str:
+    prolog = _rule_cache.get(rule)
+    if prolog is None:
+        prolog = as_prolog(rule, PROLOG_CONFIG)
+        if not prolog.endswith("."):
+            prolog += "."
+        _rule_cache.set(rule, prolog)
+    return prolog
+
+
+# horn rules for each input sentence, keyed on sentence identity, together with the constants
+# that were substituted in; an empty tuple records a sentence that is skipped
+_horn_rule_cache: IdentityCache[Tuple[Dict[str, Any], Tuple[Sentence, ...]]] = IdentityCache()
+
+
+def _horn_rules(sentence: Sentence, constants: Dict[str, Any]) -> Tuple[Sentence, ...]:
+    cached = _horn_rule_cache.get(sentence)
+    if cached is not None and cached[0] == constants:
+        return cached[1]
+    try:
+        # TODO: allow preserving existentials
+        rules = tuple(to_horn_rules(replace_constants(sentence, constants)))
+    except NotInProfileError:
+        rules = ()
+    _horn_rule_cache.set(sentence, (dict(constants), rules))
+    return rules
 
 
 def _base_type(t: str) -> str:
@@ -36,65 +80,48 @@ class SouffleCompiler(Compiler):
     default_suffix: ClassVar[str] = "dl"
 
     def compile(self, theory: Theory, syntax: Optional[Union[str, ModelSyntax]] = None, **kwargs) -> str:
-        blocks = []
+        buf = io.StringIO()
+
+        def _emit(block: str) -> None:
+            buf.write(block)
+            buf.write("\n")
 
         # for k, v in theory.constants.items():
-        #    blocks.append(f".const {k}: {_base_type(v)}")
+        #    _emit(f".const {k}: {_base_type(v)}")
         tds = theory.type_definitions or {}
         for k, v in tds.items():
             if isinstance(v, list):
                 base_types = [_base_type(x) for x in v if isinstance(x, str)]
-                blocks.append(f".type {_type(k)} = {' | '.join(base_types)}")
+                _emit(f".type {_type(k)} = {' | '.join(base_types)}")
             else:
                 if not isinstance(v, str):
                     raise NotImplementedError(f"Only string types are supported; got: {v}")
-                blocks.append(f".type {_type(k)} = {_base_type(v)}")
+                _emit(f".type {_type(k)} = {_base_type(v)}")
 
         if not theory.predicate_definitions:
             raise ValueError("No predicate definitions found in theory")
-        for pd in theory.predicate_definitions:
-            p = _pred(pd.predicate)
 
-            def _ref_type(t):
-                if t in theory.type_definitions:
-                    return _type(t)
-                else:
-                    return _base_type(t)
+        def _ref_type(t):
+            if t in tds:
+                return _type(t)
+            else:
+                return _base_type(t)
 
+        for pd in theory.predicate_definitions:
+            p = _pred(pd.predicate)
             args = [f"{_var(v)}: {_ref_type(v_typ)}" for v, v_typ in pd.arguments.items()]
-            blocks.append(f".decl {p}({', '.join(args)})")
-
-        config = PrologConfig(
-            use_lowercase_vars=True,
-            use_uppercase_predicates=None,
-            negation_symbol="!",
-            double_quote_strings=True,
-            operator_map={
-                "eq": "=",
-            },
-            include_parens_for_zero_args=True,
-        )
-
-        horn_rules = []
+            _emit(f".decl {p}({', '.join(args)})")
+
+        horn_rules: List[Sentence] = []
         for s in theory.sentences + theory.ground_terms:
-            s = replace_constants(s, theory.constants)
-            # TODO: allow preserving existentials
-            try:
-                tr_sentences = to_horn_rules(s)
-                horn_rules.extend(tr_sentences)
-            except NotInProfileError:
-                # blocks.append(f"% IGNORED: {s} // {e}")
-                continue
+            horn_rules.extend(_horn_rules(s, theory.constants))
 
         horn_rules = force_stratification(horn_rules)
         for rule in horn_rules:
             try:
-                prolog = as_prolog(rule, config)
-                if not prolog.endswith("."):
-                    prolog += "."
-                blocks.append(prolog)
+                _emit(_rule_as_prolog(rule))
             except NotInProfileError:
-                # blocks.append(f"% IGNORED: {s} // {e}")
+                # _emit(f"% IGNORED: {s} // {e}")
                 continue
 
-        return "\n".join(blocks)
+        return buf.getvalue().rstrip("\n")
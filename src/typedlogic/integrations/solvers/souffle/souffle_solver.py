@@ -1,11 +1,15 @@
 import csv
 import logging
+import os
 import subprocess
 import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar, Iterator
+from typing import Any, ClassVar, Dict, Iterator, List
 
+from typedlogic.datamodel import PredicateDefinition, Term
 from typedlogic.integrations.solvers.souffle.souffle_compiler import SouffleCompiler
 from typedlogic.profiles import (
     AllowsComparisonTerms,
@@ -20,6 +24,34 @@ from typedlogic.utils.term_maker import make_terms
 
 logger = logging.getLogger(__name__)
 
+# benign warning emitted by souffle for variables that appear once in a rule
+SINGLETON_VARIABLE_WARNING = "only occurs once"
+
+
+def _read_tsv(filename: str) -> Iterator[List[str]]:
+    """
+    Read a tab-separated file written by Souffle, one row at a time.
+
+    Souffle does not quote values, so lines are split directly rather than via the csv module.
+
+    :param filename:
+    :return: iterator over rows of values
+    """
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            yield line.rstrip("\n").split("\t")
+
+
+def _read_one(filename: str, pd: PredicateDefinition) -> List[Term]:
+    """
+    Read the Souffle output for a single predicate.
+
+    :param filename:
+    :param pd:
+    :return: ground terms
+    """
+    return make_terms(_read_tsv(filename), pd)
+
 
 @dataclass
 class SouffleSolver(Solver):
@@ -60,11 +92,15 @@ class SouffleSolver(Solver):
 
     def models(self) -> Iterator[Model]:
         compiler = SouffleCompiler()
-        program = compiler.compile(self.base_theory)
+        program_parts = [compiler.compile(self.base_theory)]
         pdmap = {}
 
+        rows_by_pred: Dict[str, List[Any]] = defaultdict(list)
+        for term in self.base_theory.ground_terms:
+            rows_by_pred[term.predicate].append(term.bindings.values())
+
         facts = []
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
             # Create output directives for each predicate
             output_files = {}
             input_files = {}
@@ -73,39 +109,35 @@ class SouffleSolver(Solver):
                 pdmap[pred] = pd
                 output_file = Path(temp_dir) / f"{pred}.csv"
                 output_files[pred] = str(output_file)
-                program += f'\n.output {pred}(IO=file, filename="{output_file}")\n'
+                program_parts.append(f'\n.output {pred}(IO=file, filename="{output_file}")\n')
                 input_file = Path(temp_dir) / f"{pred}__in.csv"
                 input_files[pred] = str(input_file)
-                program += f'\n.input {pred}(IO=file, filename="{input_file}")\n'
-                with open(input_file, "w", encoding="utf-8") as csvfile:
+                program_parts.append(f'\n.input {pred}(IO=file, filename="{input_file}")\n')
+                # one file open at a time; holding a writer per predicate open could exhaust file handles
+                with open(input_file, "w", encoding="utf-8", newline="") as csvfile:
                     writer = csv.writer(csvfile, delimiter="\t")
-                    for term in self.base_theory.ground_terms:
-                        if term.predicate == pred:
-                            writer.writerow(term.bindings.values())
-
-            with tempfile.NamedTemporaryFile(suffix=".dl", mode="w") as fp:
-                fp.write(program)
-                fp.flush()
-                res = subprocess.run([self.exec_name, fp.name], capture_output=True)
-                if res.stderr:
-                    msg = res.stderr.decode()
-                    import re
-
-                    if re.match(r".*Variable (\S+) only occurs once.*", msg):
-                        logger.info(msg)
-                    else:
-                        logger.error(msg)
-
-            for pred, filename in output_files.items():
-                if not Path(filename).exists():
-                    continue
-                pd = pdmap[pred]
-                rows = []
-                with open(filename, "r") as csvfile:
-                    reader = csv.reader(csvfile, delimiter="\t")
-                    for row in reader:
-                        rows.append(row)
-                facts.extend(make_terms(rows, pd))
+                    writer.writerows(rows_by_pred.get(pred, ()))
+
+            program_path = Path(temp_dir) / "program.dl"
+            program_path.write_text("".join(program_parts), encoding="utf-8")
+            # stdout is not used (results are written to files); stderr goes to a file rather than a pipe
+            with open(Path(temp_dir) / "souffle.err", "w+b") as errf:
+                subprocess.run([self.exec_name, str(program_path)], stdout=subprocess.DEVNULL, stderr=errf)
+                errf.seek(0)
+                err = errf.read()
+            if err:
+                msg = err.decode()
+                if SINGLETON_VARIABLE_WARNING in msg:
+                    logger.info(msg)
+                else:
+                    logger.error(msg)
+
+            outputs = [(filename, pdmap[pred]) for pred, filename in output_files.items() if Path(filename).exists()]
+            if outputs:
+                # predicates are parsed independently; results are collected in predicate order
+                with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as executor:
+                    for terms in executor.map(lambda args: _read_one(*args), outputs):
+                        facts.extend(terms)
 
         model = Model(source_object=self, ground_terms=facts)
         yield model
@@ -1,6 +1,23 @@
-from copy import copy
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable, ClassVar, Dict, Iterator, List, Mapping, Optional, Set, Type, Union
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import z3
 from z3 import SortRef
@@ -9,7 +26,7 @@ import typedlogic as tlog
 import typedlogic.pybridge
 from typedlogic import FactMixin, Variable
 from typedlogic.builtins import NUMERIC_BUILTINS
-from typedlogic.datamodel import DefinedType, PredicateDefinition, Sentence, Term
+from typedlogic.datamodel import DefinedType, PredicateDefinition, QuantifiedSentence, Sentence, Term
 from typedlogic.parsers.pyparser.python_ast_utils import logger
 from typedlogic.profiles import (
     AllowsComparisonTerms,
@@ -22,12 +39,47 @@ from typedlogic.profiles import (
 )
 from typedlogic.pybridge import fact_arg_map, fact_predicate
 from typedlogic.solver import Model, Solution, Solver
+from typedlogic.utils.type_dispatch import lookup_handler
 
-SORT_MAP: Mapping[str, Type[SortRef]] = {
-    "str": z3.StringSort,
-    "int": z3.IntSort,
-    "bool": z3.BoolSort,
-    "float": z3.RealSort,
+SORT_MAP: Mapping[str, SortRef] = {
+    "str": z3.StringSort(),
+    "int": z3.IntSort(),
+    "bool": z3.BoolSort(),
+    "float": z3.RealSort(),
+}
+
+
+def _interned(valf: Callable[[Any], z3.ExprRef]) -> Callable[[Any], z3.ExprRef]:
+    """
+    Wrap a Z3 value constructor so that repeated literals share a single expression.
+
+        >>> string_val = _interned(z3.StringVal)
+        >>> string_val("a") is string_val("a")
+        True
+
+    :param valf: value constructor, e.g. z3.StringVal
+    :return: caching value constructor
+    """
+    cached = lru_cache(maxsize=4096, typed=True)(valf)
+
+    def _valf(value: Any) -> z3.ExprRef:
+        try:
+            return cached(value)
+        except TypeError:
+            # unhashable value
+            return valf(value)
+
+    return _valf
+
+
+STRING_VAL = _interned(z3.StringVal)
+
+# value constructors for literals, keyed on sort
+T2M_MAP: Mapping[SortRef, Callable[[Any], z3.ExprRef]] = {
+    SORT_MAP["str"]: STRING_VAL,
+    SORT_MAP["int"]: _interned(z3.IntVal),
+    SORT_MAP["bool"]: _interned(z3.BoolVal),
+    SORT_MAP["float"]: _interned(z3.RealVal),
 }
 
 
@@ -36,6 +88,8 @@ def get_models(s: z3.Solver, M: int) -> List[z3.Model]:
     # https://stackoverflow.com/questions/11867611/z3py-checking-all-solutions-for-equation
     # https://github.com/Z3Prover/z3/issues/5765
     result: List[z3.Model] = []
+    # constants for each declaration, checked once and reused across models; None marks a skipped declaration
+    consts: Dict[z3.FuncDecl, Optional[z3.ExprRef]] = {}
     s.push()
     while len(result) < M and s.check() == z3.sat:
         m = s.model()
@@ -44,20 +98,30 @@ def get_models(s: z3.Solver, M: int) -> List[z3.Model]:
         block = []
         for d in m:
             # d is a declaration
-            if d.arity() > 0:
-                logger.warning(f"ignoring uninterpreted function {d}")
-                continue
-                # raise z3.Z3Exception(f"uninterpreted functions are not supported; {d}")
-            # create a constant from declaration
-            c = d()
-            if z3.is_array(c) or c.sort().kind() == z3.Z3_UNINTERPRETED_SORT:
-                raise z3.Z3Exception("arrays and uninterpreted sorts are not supported")
-            block.append(c != m[d])
+            if d not in consts:
+                if d.arity() > 0:
+                    logger.warning(f"ignoring uninterpreted function {d}")
+                    consts[d] = None
+                    continue
+                    # raise z3.Z3Exception(f"uninterpreted functions are not supported; {d}")
+                # create a constant from declaration
+                c = d()
+                if z3.is_array(c) or c.sort().kind() == z3.Z3_UNINTERPRETED_SORT:
+                    raise z3.Z3Exception("arrays and uninterpreted sorts are not supported")
+                consts[d] = c
+            c = consts[d]
+            if c is not None:
+                block.append(c != m[d])
         s.add(z3.Or(block))
     s.pop()
     return result
 
 
+# Z3 translations of the subformulas in one quantifier scope, keyed on sentence identity;
+# values hold the sentence, so that its id cannot be reused while the entry exists
+TranslationMemo = Dict[int, Tuple[Sentence, z3.ExprRef]]
+
+
 @dataclass
 class Z3Solver(Solver):
     """
@@ -87,6 +151,12 @@ class Z3Solver(Solver):
     # TODO: rename this
     predicate_map: Optional[Dict[str, z3.FuncDecl]] = None
 
+    _sort_cache: Dict[Optional[str], z3.SortRef] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _val_cache: Dict[type, Callable[[Any], z3.ExprRef]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _unrolled_type_cache: Dict[str, FrozenSet[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self._wrapped_solver is None:
             self._wrapped_solver = z3.Solver()
@@ -122,56 +192,104 @@ class Z3Solver(Solver):
         s.pop()
         return result == z3.unsat
 
-    def _unroll_type(self, typ: DefinedType) -> Set[str]:
+    def _unroll_type(self, typ: DefinedType) -> FrozenSet[str]:
         """
         Unroll a defined type into its components
 
+            >>> from typedlogic import Theory
+            >>> solver = Z3Solver()
+            >>> solver.add_theory(Theory(type_definitions={"Number": ["int", "float"], "Thing": ["Number", "str"]}))
+            >>> sorted(solver._unroll_type("Thing"))
+            ['float', 'int', 'str']
+
         :param typ:
         :return:
         """
         if isinstance(typ, str):
-            if typ in self.type_definitions:
-                return self._unroll_type(self.base_theory.type_definitions[typ])
-            return {typ}
-        if isinstance(typ, list):
-            ts: List[str] = []
-            for t in typ:
-                ts.extend(self._unroll_type(t))
-            return set(ts)
-        raise ValueError(f"Unknown type {typ}")
-
-    def _sort(self, typ: Optional[str] = None) -> Union[Callable, Type[z3.SortRef]]:
-        # TODO: change this to return instantiated sort, not the sort class
+            cached = self._unrolled_type_cache.get(typ)
+            if cached is not None:
+                return cached
+        type_definitions = self.base_theory.type_definitions
+        unrolled: Set[str] = set()
+        expanded: Set[str] = set()
+        worklist: Deque[Any] = deque([typ])
+        while worklist:
+            t = worklist.popleft()
+            if isinstance(t, str):
+                if t not in type_definitions:
+                    unrolled.add(t)
+                elif t not in expanded:
+                    expanded.add(t)
+                    worklist.append(type_definitions[t])
+            elif isinstance(t, list):
+                worklist.extend(t)
+            else:
+                raise ValueError(f"Unknown type {t}")
+        result = frozenset(unrolled)
+        if isinstance(typ, str):
+            self._unrolled_type_cache[typ] = result
+        return result
+
+    def _sort(self, typ: Optional[str] = None) -> z3.SortRef:
+        """
+        Get the Z3 sort for a type.
+
+            >>> solver = Z3Solver()
+            >>> solver._sort("int")
+            Int
+            >>> solver._sort("int") is solver._sort("int")
+            True
+
+        :param typ: type name; defaults to str
+        :return: instantiated sort
+        """
+        if not isinstance(typ, (str, type(None))):
+            return self._make_sort(typ)
+        sort = self._sort_cache.get(typ)
+        if sort is None:
+            sort = self._make_sort(typ)
+            self._sort_cache[typ] = sort
+        return sort
+
+    def _make_sort(self, typ: Optional[DefinedType]) -> z3.SortRef:
         if not typ:
-            return z3.StringSort
-        typs = self._unroll_type(typ)
+            return z3.StringSort()
         repl_map = {
             "Decimal": "float",
         }
-        typs = {repl_map.get(t, t) for t in typs}
+        typs = {repl_map.get(t, t) for t in self._unroll_type(typ)}
         if "float" in typs and "int" in typs:
             typs = typs.difference({"int"})
         if len(typs) > 1:
             # unions not directly supported
             # TODO: add constraints
-            return lambda: z3.DeclareSort(typ)
+            return z3.DeclareSort(str(typ))
         typ = list(typs)[0]
         if not isinstance(typ, str):
             # TODO - we should ensure types are strings
             typ = typ.__name__
-        return SORT_MAP.get(typ, z3.StringSort)
+        return SORT_MAP.get(typ, SORT_MAP["str"])
 
     def _const(self, value: Any, typ: str) -> z3.Const:
-        sort = self._sort(typ)
-        return z3.Const(value, sort())
+        return z3.Const(value, self._sort(typ))
 
-    def _func(self, name: str, *args) -> z3.FuncDecl:
-        args = tuple([args] + [z3.BoolSort()])
-        return z3.Function(name, *args)
+    @staticmethod
+    def _func(name: str, *args: z3.SortRef) -> z3.FuncDecl:
+        """
+        Declare a predicate as a boolean-valued function.
+
+            >>> Z3Solver._func("P", z3.IntSort(), z3.StringSort())
+            P
+
+        :param name: predicate name
+        :param args: argument sorts
+        :return: function declaration
+        """
+        return z3.Function(name, *args, z3.BoolSort())
 
     def _tr(self, var: Any, bindings: dict) -> z3.ExprRef:
         if var is None:
-            return z3.StringVal("None")
+            return STRING_VAL("None")
         if isinstance(var, Variable):
             if var.name not in bindings:
                 if var.name in self.constants:
@@ -181,20 +299,47 @@ class Z3Solver(Solver):
             else:
                 pf_arg = bindings[var.name]
             return pf_arg
-        py_typ = type(var).__name__
-        z3_typ = self._sort(py_typ)
-        t2m_map = {
-            z3.StringSort: z3.StringVal,
-            z3.IntSort: z3.IntVal,
-            z3.BoolSort: z3.BoolVal,
-            z3.RealSort: z3.RealVal,
-        }
-        z3_valf = t2m_map.get(z3_typ, z3.StringVal)
-        return z3_valf(var)
+        return self._val(var)
+
+    def _val(self, value: Any) -> z3.ExprRef:
+        """
+        Translate a literal value, using the value constructor for the sort of its python type.
+
+            >>> solver = Z3Solver()
+            >>> solver._val(5).sort()
+            Int
+            >>> solver._val("x").sort()
+            String
+
+        :param value:
+        :return: Z3 value
+        """
+        py_typ = type(value)
+        z3_valf = self._val_cache.get(py_typ)
+        if z3_valf is None:
+            z3_valf = T2M_MAP.get(self._sort(py_typ.__name__), STRING_VAL)
+            self._val_cache[py_typ] = z3_valf
+        return z3_valf(value)
 
     def add_fact(self, fact: FactMixin) -> None:
         return self.add_sentence(fact)
 
+    def add_theory(self, theory: tlog.Theory) -> None:
+        """
+        Add a theory to the solver.
+
+        Any cached sorts are discarded if the theory brings in new type definitions.
+
+        :param theory:
+        :return:
+        """
+        if theory.type_definitions:
+            # sorts may depend on type definitions
+            self._sort_cache.clear()
+            self._val_cache.clear()
+            self._unrolled_type_cache.clear()
+        super().add_theory(theory)
+
     def add_sentence(self, sentence: Sentence) -> None:
         # normalize_variables(sentence)
         z3_expr = self.translate(sentence)
@@ -209,7 +354,7 @@ class Z3Solver(Solver):
         :param predicate_definition:
         :return:
         """
-        args = [self._sort(a)() for a in predicate_definition.arguments.values()]
+        args = [self._sort(a) for a in predicate_definition.arguments.values()]
         args += [z3.BoolSort()]
         p = z3.Function(predicate_definition.predicate, *args)
         if not self.predicate_map:
@@ -227,115 +372,160 @@ class Z3Solver(Solver):
         :param bindings: local bindings of variable names to Z3 Sorts
         :return: The Z3 expression
         """
-        if isinstance(sentence, tlog.And):
-            return z3.And(*[self.translate(op, bindings) for op in sentence.operands])
-        if isinstance(sentence, tlog.Or):
-            return z3.Or(*[self.translate(op, bindings) for op in sentence.operands])
-        if isinstance(sentence, tlog.Xor):
-            return z3.Xor(*[self.translate(op, bindings) for op in sentence.operands])
-        if isinstance(sentence, tlog.ExactlyOne):
-            disj = []
-            for a in sentence.operands:
-                disj.append(
-                    z3.And(
-                        self.translate(a, bindings),
-                        *[z3.Not(self.translate(b, bindings)) for b in sentence.operands if b != a],
-                    )
-                )
-            return z3.Or(*disj)
-        if isinstance(sentence, tlog.Not):
-            return z3.Not(self.translate(sentence.operands[0], bindings))
-        if isinstance(sentence, tlog.Iff):
-            # rewrite
-            lhs = sentence.left
-            rhs = sentence.right
-            rewritten = tlog.And(tlog.Implies(lhs, rhs), tlog.Implies(rhs, lhs))
-            return self.translate(rewritten, bindings)
-        if isinstance(sentence, tlog.Implied):
-            # rewrite
-            lhs = sentence.operands[0]
-            rhs = sentence.operands[1]
-            return self.translate(tlog.Implies(rhs, lhs), bindings)
-        if isinstance(sentence, tlog.Implies):
-            lhs = self.translate(sentence.operands[0], bindings)
-            rhs = self.translate(sentence.operands[1], bindings)
-            return z3.Implies(lhs, rhs)
-        if isinstance(sentence, (tlog.Forall, tlog.Exists)):
-            if not bindings:
-                bindings = {}
-            args = []
-            for v in sentence.variables:
-                var_name = v.name
-                domain = v.domain
-                s = self._sort(domain)
-                arg = z3.Const(var_name, s())  ## TODO
-                bindings[var_name] = arg
-                args.append(arg)
-            inner_sentence = self.translate(sentence.sentence, bindings)
-            if isinstance(sentence, tlog.Exists):
-                return z3.Exists(args, inner_sentence)
-            else:
-                return z3.ForAll(args, inner_sentence)
-        if isinstance(sentence, (tlog.Term, typedlogic.pybridge.FactMixin)):  # TODO: use Expression
-            if isinstance(sentence, typedlogic.pybridge.FactMixin):
-                sentence = tlog.Term(fact_predicate(sentence), fact_arg_map(sentence))
-            if not self.predicate_map or not self.predicate_definitions:
-                raise ValueError("You must add predicate definitions before adding facts")
-            pd = self.predicate_definitions.get(sentence.predicate)
-            pf = self.predicate_map.get(sentence.predicate)
-            if pf is None and sentence.predicate in NUMERIC_BUILTINS:
-                pf = NUMERIC_BUILTINS[sentence.predicate]
-            elif pf is None or pd is None:
-                raise ValueError(
-                    f"Predicate {sentence.predicate} not found in {self.predicate_map}\n"
-                    "Did you remember to declare these as predicates?"
-                )
-            elif sentence.positional:
-                # TODO: more elegant way to do this
-                sentence = copy(sentence)
-                sentence.make_keyword_indexed(list(pd.arguments.keys()))
-            pf_args = []
-            for arg_name, var in sentence.bindings.items():
-                if not bindings:
-                    bindings = {}
-                if isinstance(var, Variable):
-                    if var.name not in bindings:
-                        if var.name in self.constants:
-                            pf_arg = self.constants[var.name]
-                        else:
-                            raise ValueError(f"Variable {var.name} not bound in {bindings} or {self.constants}")
-                    else:
-                        pf_arg = bindings[var.name]
-                    pf_args.append(pf_arg)
-                elif isinstance(var, Term):
-                    args = [self._tr(a, bindings) for a in var.values]
-                    p = var.predicate
-                    if p == "add":
-                        pf_args.append(args[0] + args[1])
-                    elif p == "gt":
-                        pf_args.append(args[0] > args[1])
+        # subformulas that are shared within the sentence are translated once
+        return self._translate(sentence, bindings, {})
+
+    def _translate(
+        self, sentence: Sentence, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        entry = memo.get(id(sentence))
+        if entry is not None:
+            return entry[1]
+        handler = lookup_handler(self._TRANSLATE_DISPATCH, type(sentence))
+        if handler is None:
+            raise NotImplementedError(f"Not implemented:{type(sentence)} :: {sentence}")
+        expr = handler(self, sentence, bindings, memo)
+        memo[id(sentence)] = (sentence, expr)
+        return expr
+
+    def _translate_and(
+        self, sentence: tlog.And, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        return z3.And(*[self._translate(op, bindings, memo) for op in sentence.operands])
+
+    def _translate_or(
+        self, sentence: tlog.Or, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        return z3.Or(*[self._translate(op, bindings, memo) for op in sentence.operands])
+
+    def _translate_xor(
+        self, sentence: tlog.Xor, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        return z3.Xor(*[self._translate(op, bindings, memo) for op in sentence.operands])
+
+    def _translate_exactly_one(
+        self, sentence: tlog.ExactlyOne, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        # pseudo-boolean cardinality constraint; linear in the number of operands
+        ops = [self._translate(op, bindings, memo) for op in sentence.operands]
+        return z3.PbEq([(op, 1) for op in ops], 1)
+
+    def _translate_not(
+        self, sentence: tlog.Not, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        return z3.Not(self._translate(sentence.operands[0], bindings, memo))
+
+    def _translate_iff(
+        self, sentence: tlog.Iff, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        # rewrite
+        lhs = sentence.left
+        rhs = sentence.right
+        rewritten = tlog.And(tlog.Implies(lhs, rhs), tlog.Implies(rhs, lhs))
+        return self._translate(rewritten, bindings, memo)
+
+    def _translate_implied(
+        self, sentence: tlog.Implied, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        # rewrite
+        lhs = sentence.operands[0]
+        rhs = sentence.operands[1]
+        return self._translate(tlog.Implies(rhs, lhs), bindings, memo)
+
+    def _translate_implies(
+        self, sentence: tlog.Implies, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        lhs = self._translate(sentence.operands[0], bindings, memo)
+        rhs = self._translate(sentence.operands[1], bindings, memo)
+        return z3.Implies(lhs, rhs)
+
+    def _translate_quantified(
+        self, sentence: QuantifiedSentence, bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        if not bindings:
+            bindings = {}
+        args = []
+        for v in sentence.variables:
+            var_name = v.name
+            domain = v.domain
+            arg = z3.Const(var_name, self._sort(domain))  ## TODO
+            bindings[var_name] = arg
+            args.append(arg)
+        # the body is translated under new bindings, so translations from the enclosing scope do not apply
+        inner_sentence = self._translate(sentence.sentence, bindings, {})
+        if isinstance(sentence, tlog.Exists):
+            return z3.Exists(args, inner_sentence)
+        else:
+            return z3.ForAll(args, inner_sentence)
+
+    def _translate_term(
+        self, sentence: Union[Term, FactMixin], bindings: Optional[Dict[str, z3.SortRef]], memo: TranslationMemo
+    ) -> z3.ExprRef:
+        # TODO: use Expression
+        if isinstance(sentence, typedlogic.pybridge.FactMixin):
+            sentence = tlog.Term(fact_predicate(sentence), fact_arg_map(sentence))
+        if not self.predicate_map or not self.predicate_definitions:
+            raise ValueError("You must add predicate definitions before adding facts")
+        pd = self.predicate_definitions.get(sentence.predicate)
+        pf = self.predicate_map.get(sentence.predicate)
+        if pf is None and sentence.predicate in NUMERIC_BUILTINS:
+            pf = NUMERIC_BUILTINS[sentence.predicate]
+        elif pf is None or pd is None:
+            raise ValueError(
+                f"Predicate {sentence.predicate} not found in {self.predicate_map}\n"
+                "Did you remember to declare these as predicates?"
+            )
+        values: Iterable[Any] = sentence.bindings.values()
+        if pd is not None and sentence.positional:
+            # only the argument values are used; like keyword indexing, ignore any beyond the declared arity
+            values = islice(values, len(pd.arguments))
+        if not bindings:
+            bindings = {}
+        pf_args = []
+        for var in values:
+            if isinstance(var, Variable):
+                if var.name not in bindings:
+                    if var.name in self.constants:
+                        pf_arg = self.constants[var.name]
                     else:
-                        raise NotImplementedError(f"Term not implemented: {var}")
-                elif var is None:
-                    pf_args.append(z3.StringVal("None"))
+                        raise ValueError(f"Variable {var.name} not bound in {bindings} or {self.constants}")
                 else:
-                    py_typ = type(var).__name__
-                    z3_typ = self._sort(py_typ)
-                    t2m_map = {
-                        z3.StringSort: z3.StringVal,
-                        z3.IntSort: z3.IntVal,
-                        z3.BoolSort: z3.BoolVal,
-                        z3.RealSort: z3.RealVal,
-                    }
-                    z3_valf = t2m_map.get(z3_typ, z3.StringVal)
-                    pf_arg = z3_valf(var)
-                    pf_args.append(pf_arg)
-            try:
-                z3_expr = pf(*pf_args)
-            except Exception as e:
-                raise ValueError(f"Error translating {sentence} args: {pf_args} to Z3 using {pf}:\n{e}")
-            return z3_expr
-        raise NotImplementedError(f"Not implemented:{type(sentence)} :: {sentence}")
+                    pf_arg = bindings[var.name]
+                pf_args.append(pf_arg)
+            elif isinstance(var, Term):
+                args = [self._tr(a, bindings) for a in var.values]
+                p = var.predicate
+                if p == "add":
+                    pf_args.append(args[0] + args[1])
+                elif p == "gt":
+                    pf_args.append(args[0] > args[1])
+                else:
+                    raise NotImplementedError(f"Term not implemented: {var}")
+            elif var is None:
+                pf_args.append(STRING_VAL("None"))
+            else:
+                pf_args.append(self._val(var))
+        try:
+            z3_expr = pf(*pf_args)
+        except Exception as e:
+            raise ValueError(f"Error translating {sentence} args: {pf_args} to Z3 using {pf}:\n{e}")
+        return z3_expr
+
+    # dispatch table for translate, keyed on sentence type; see lookup_handler
+    _TRANSLATE_DISPATCH: ClassVar[Dict[type, Optional[Callable]]] = {
+        tlog.And: _translate_and,
+        tlog.Or: _translate_or,
+        tlog.Xor: _translate_xor,
+        tlog.ExactlyOne: _translate_exactly_one,
+        tlog.Not: _translate_not,
+        tlog.Iff: _translate_iff,
+        tlog.Implied: _translate_implied,
+        tlog.Implies: _translate_implies,
+        tlog.Forall: _translate_quantified,
+        tlog.Exists: _translate_quantified,
+        tlog.Term: _translate_term,
+        typedlogic.pybridge.FactMixin: _translate_term,
+    }
 
     def dump(self) -> str:
         return str(self.wrapped_solver)
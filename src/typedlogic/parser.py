@@ -2,12 +2,15 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import ModuleType
-from typing import Any, ClassVar, Iterator, List, Optional, TextIO, Union
+from typing import Any, ClassVar, Dict, Hashable, Iterator, List, Optional, TextIO, Tuple, Union
 
 from typedlogic import Sentence, Term, Theory
 
+# maximum number of parse results kept by each parser
+PARSE_CACHE_SIZE = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationMessage:
     """
     A message from a parser that indicates the result of a validation.
@@ -37,6 +40,9 @@ class Parser(ABC):
 
     default_suffix: ClassVar[str] = "txt"
     auto_validate: Optional[bool] = None
+    _parse_cache: Dict[Tuple[Hashable, Tuple], Theory] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def parse_file(self, source: Union[Path, str, TextIO], **kwargs) -> Theory:
         if isinstance(source, str):
@@ -78,8 +84,8 @@ class Parser(ABC):
         :param kwargs:
         :return:
         """
-        theory = self.parse(source, **kwargs)
-        return theory.sentences
+        theory = self._parse_cached(source, **kwargs)
+        return list(theory.sentences)
 
     def parse_ground_terms(self, source: Union[Path, str, TextIO], **kwargs) -> List[Term]:
         """
@@ -89,8 +95,36 @@ class Parser(ABC):
         :param kwargs:
         :return:
         """
-        theory = self.parse(source, **kwargs)
-        return theory.ground_terms
+        theory = self._parse_cached(source, **kwargs)
+        return list(theory.ground_terms)
+
+    def _parse_cached(self, source: Union[Path, str, TextIO], **kwargs) -> Theory:
+        """
+        Parse a source, reusing the result of an earlier parse of the same file.
+
+        Only paths are cached, keyed on their resolved name, modification time and size.
+        Strings are not cached, as some parsers treat them as file paths, and others as source text.
+        At most PARSE_CACHE_SIZE results are kept, dropping the oldest first.
+
+        :param source:
+        :param kwargs:
+        :return:
+        """
+        if not isinstance(source, Path):
+            return self.parse(source, **kwargs)
+        try:
+            st = source.stat()
+            key = ((str(source.resolve()), st.st_mtime_ns, st.st_size), tuple(sorted(kwargs.items())))
+            theory = self._parse_cache.get(key)
+        except (OSError, TypeError):
+            # missing file, or unhashable keyword arguments
+            return self.parse(source, **kwargs)
+        if theory is None:
+            theory = self.parse(source, **kwargs)
+            if len(self._parse_cache) >= PARSE_CACHE_SIZE:
+                del self._parse_cache[next(iter(self._parse_cache))]
+            self._parse_cache[key] = theory
+        return theory
 
     def translate(self, source: Any, **kwargs) -> Theory:
         """
@@ -1,10 +1,14 @@
 import ast
 import importlib
 import inspect
+import os
+import sys
 import types
 import typing
-from dataclasses import fields, Field
-from types import ModuleType
+import weakref
+from dataclasses import Field, fields, is_dataclass
+from functools import lru_cache
+from types import FunctionType, ModuleType
 from typing import Any, Dict, List, NewType, Tuple, Type, Union, Optional
 
 from typedlogic import Fact, FactMixin, Theory
@@ -12,6 +16,11 @@ from typedlogic.datamodel import DefinedType, PredicateDefinition, SentenceGroup
 from typedlogic.parsers.pyparser.python_ast_utils import SentenceGroup, parse_function_def_to_sentence_group
 from typedlogic.transformations import ensure_terms_positional, sentences_from_predicate_hierarchy
 
+try:
+    from pydantic import BaseModel as PydanticBaseModel
+except ImportError:  # pragma: no cover
+    PydanticBaseModel = None  # type: ignore[assignment,misc]
+
 
 def translate_module_to_theory(module: ModuleType) -> Theory:
     """
@@ -25,9 +34,10 @@ def translate_module_to_theory(module: ModuleType) -> Theory:
     :param module:
     :return:
     """
+    module_vars = get_module_vars(module)
     sgs = get_module_sentence_groups(module)
-    pds = get_module_predicate_definitions(module)
-    constants, tds = get_module_constants_and_types(module)
+    pds = get_module_predicate_definitions(module, module_vars)
+    constants, tds = get_module_constants_and_types(module, module_vars)
     # get the python module name
     theory = Theory(
         name=module.__name__,
@@ -45,8 +55,9 @@ def translate_module_to_theory(module: ModuleType) -> Theory:
 
 # TODO: unused function; decide if we want to allow axiom-level
 def get_axioms_ast(cls: Type):
-    class_def = ast.parse(ast.unparse(ast.parse(inspect.getsource(cls))))
-    for node in ast.walk(class_def):
+    # the source of a class is a module containing just its ClassDef
+    class_def = ast.parse(inspect.getsource(cls))
+    for node in class_def.body:
         if isinstance(node, ast.ClassDef) and node.name == cls.__name__:
             for item in node.body:
                 if isinstance(item, ast.FunctionDef) and item.name == "axioms":
@@ -54,25 +65,63 @@ def get_axioms_ast(cls: Type):
     return None
 
 
-def get_module_sentence_groups(module: Union[ModuleType, str]) -> List[SentenceGroup]:
+# sentence group type for each decorator name, e.g. @axiom
+DECORATOR_TYPES = {x.value: x for x in SentenceGroupType}
+
+# parsed module source, keyed on file path; entries record the file's modification time and size
+_module_ast_cache: Dict[str, Tuple[int, int, ast.Module]] = {}
+
+
+def _module_ast(module: ModuleType) -> ast.Module:
+    """
+    Parse the source of a module, reusing the tree if the module's file is unchanged.
+
+    The returned tree is shared, and must not be modified.
+
+    :param module:
+    :return: parsed module
+    """
+    path = getattr(module, "__file__", None)
+    if not path:
+        return ast.parse(inspect.getsource(module))
+    st = os.stat(path)
+    cached = _module_ast_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    if path.endswith(".py"):
+        # read directly rather than via inspect/linecache; parsing bytes honours any coding declaration
+        with open(path, "rb") as f:
+            module_ast = ast.parse(f.read(), filename=path)
+    else:
+        module_ast = ast.parse(inspect.getsource(module))
+    _module_ast_cache[path] = (st.st_mtime_ns, st.st_size, module_ast)
+    return module_ast
+
+
+def get_module_sentence_groups(module: Union[ModuleType, str, ast.Module]) -> List[SentenceGroup]:
     """
     Get the AST nodes of all axiom functions in a module.
 
-    :param module: The module to introspect
+    :param module: The module to introspect, its source, or its parsed source
     :return: A list of AST FunctionDef nodes for axiom functions
     """
-    if not isinstance(module, str):
-        module = inspect.getsource(module)
-    module_ast = ast.parse(module)
+    if isinstance(module, ast.Module):
+        module_ast = module
+    elif isinstance(module, str):
+        module_ast = ast.parse(module)
+    else:
+        module_ast = _module_ast(module)
     # module_vars = {k: v for k, v in vars(module).items() if not k.startswith('__')}
     sgs = []
-    decorator_types = {x.value: x for x in SentenceGroupType}
     for node in module_ast.body:
         if isinstance(node, ast.FunctionDef):
             for decorator in node.decorator_list:
-                if isinstance(decorator, ast.Name) and decorator.id in decorator_types:
+                if not isinstance(decorator, ast.Name):
+                    continue
+                group_type = DECORATOR_TYPES.get(decorator.id)
+                if group_type is not None:
                     sg = parse_function_def_to_sentence_group(node)
-                    sg.group_type = decorator_types[decorator.id]
+                    sg.group_type = group_type
                     # TODO:
                     # if sg.argument_types is not None:
                     #    sg.argument_types = {k: safe_eval_type(v, module_vars) for k, v in sg.argument_types.items()}
@@ -81,23 +130,37 @@ def get_module_sentence_groups(module: Union[ModuleType, str]) -> List[SentenceG
     return sgs
 
 
-def get_module_predicate_classes(module: ModuleType) -> Dict[str, Type]:
+def get_module_vars(module: ModuleType) -> Dict[str, Any]:
+    """
+    Get the variables of a module, excluding dunder attributes.
+
+    :param module: The module to introspect
+    :return: A dictionary of variable names to values
+    """
+    return {k: v for k, v in vars(module).items() if not k.startswith("__")}
+
+
+def get_module_predicate_classes(module: ModuleType, module_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Type]:
     """
     Get all classes defined in a module.
 
     :param module: The module to introspect
+    :param module_vars: variables of the module, if already computed
     :return: A dictionary of class names to class types
     """
-    module_vars = {k: v for k, v in vars(module).items() if not k.startswith("__")}
+    if module_vars is None:
+        module_vars = get_module_vars(module)
     classes = {}
     for name, obj in module_vars.items():
-        if not inspect.isclass(obj):
+        if not isinstance(obj, type):
             continue
-        if inspect.isabstract(obj):
+        if obj is Fact or obj is FactMixin:
             continue
-        if obj in {Fact, FactMixin}:
+        # FactMixin is an ABC, but facts are never registered as virtual subclasses,
+        # so a direct MRO check avoids the slower ABC subclass check
+        if FactMixin not in obj.__mro__:
             continue
-        if not issubclass(obj, FactMixin):
+        if inspect.isabstract(obj):
             continue
         classes[name] = obj
     return classes
@@ -110,40 +173,58 @@ JSON_SCHEMA_TYPE_MAP = {
 }
 
 
+def _parse_json_schema_type(s: Dict[str, Any]) -> DefinedType:
+    if "anyOf" in s:
+        return [_parse_json_schema_type(x) for x in s["anyOf"]]
+    return s.get("type", "str")
+
+
+# attributes for each predicate class; weakly keyed, as classes may be created dynamically
+_attributes_cache: "weakref.WeakKeyDictionary[type, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
 def introspect_attributes(cls: Type) -> dict[str, Any]:
+    """
+    Get the attribute names and type names of a predicate class.
+
+    Results are cached per class.
+
+    :param cls: dataclass or pydantic model
+    :return: A dictionary of attribute names to type names
+    """
+    attributes = _attributes_cache.get(cls)
+    if attributes is None:
+        attributes = _introspect_attributes(cls)
+        _attributes_cache[cls] = attributes
+    return dict(attributes)
+
+
+def _introspect_attributes(cls: Type) -> dict[str, Any]:
     # https://stackoverflow.com/questions/69090253/how-to-iterate-over-attributes-of-dataclass-in-python
-    try:
-        import pydantic
-
-        if issubclass(cls, pydantic.BaseModel):
-            # TODO: conversion to JSON schema in Pydantic erases type information,
-            # and will incorrectly assign strs to some Unions.
-            schema = cls.model_json_schema()
-            r = {}
-            for p, p_schema in schema["properties"].items():
-
-                def _parse_type(s) -> DefinedType:
-                    if "anyOf" in s:
-                        return [_parse_type(x) for x in s["anyOf"]]
-                    return s.get("type", "str")
-
-                t = _parse_type(p_schema)
-                if isinstance(t, str):
-                    r[p] = JSON_SCHEMA_TYPE_MAP.get(t, t)
-                else:
-                    # TODO
-                    r[p] = JSON_SCHEMA_TYPE_MAP["string"]
-            return r
-    except ImportError:
-        pass  # Get all attributes of the class
-    if fields(cls):
+    if PydanticBaseModel is not None and issubclass(cls, PydanticBaseModel):
+        # TODO: conversion to JSON schema in Pydantic erases type information,
+        # and will incorrectly assign strs to some Unions.
+        schema = cls.model_json_schema()
+        r = {}
+        for p, p_schema in schema["properties"].items():
+            t = _parse_json_schema_type(p_schema)
+            if isinstance(t, str):
+                # names from the schema are fresh strings; interning shares them across predicates
+                r[p] = sys.intern(JSON_SCHEMA_TYPE_MAP.get(t, t))
+            else:
+                # TODO
+                r[p] = JSON_SCHEMA_TYPE_MAP["string"]
+        return r
+    # Get all attributes of the class; checked up front, as fields() raises TypeError for non-dataclasses
+    dc_fields = fields(cls) if is_dataclass(cls) else ()
+    if dc_fields:
 
         def _field_type_name(f: Field) -> str:
             if not hasattr(f.type, "__name__"):
                 raise ValueError(f"Cannot introspect field type for: {f.type} field: {f} in {cls}")
-            return f.type.__name__
+            return sys.intern(f.type.__name__)
 
-        r = {field.name: _field_type_name(field) for field in fields(cls)}
+        r = {field.name: _field_type_name(field) for field in dc_fields}
         return r
     return {}
 
@@ -162,46 +243,102 @@ def introspect_attributes(cls: Type) -> dict[str, Any]:
     # return {attr[0]: attr[1] for attr in non_classvar_attributes}
 
 
-def get_module_constants(module: ModuleType) -> Dict[str, Any]:
+def get_module_constants(module: ModuleType, module_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Get all constants defined in a module.
 
     :param module: The module to introspect
+    :param module_vars: variables of the module, if already computed
     :return: A dictionary of constant names to constant values
     """
-    module_vars = {k: v for k, v in vars(module).items() if not k.startswith("__")}
+    if module_vars is None:
+        module_vars = get_module_vars(module)
     constants = {}
     for name, obj in module_vars.items():
-        if not inspect.isclass(obj) and not inspect.isfunction(obj):
+        if not isinstance(obj, (type, FunctionType)):
             constants[name] = obj
     return constants
 
 
 def is_union(t):
-    if str(t).startswith("typing.Union"):
+    """
+    Check if an object is a union type.
+
+        >>> is_union(Union[int, str])
+        True
+        >>> is_union(int | str)
+        True
+        >>> is_union(int)
+        False
+
+    Optional types are not treated as unions:
+
+        >>> is_union(Optional[int])
+        False
+
+    :param t:
+    :return:
+    """
+    if t is Union or isinstance(t, types.UnionType):
         return True
-    # For Python 3.10+
-    if hasattr(types, "UnionType"):
-        return isinstance(t, types.UnionType)
+    if typing.get_origin(t) is not Union:
+        return False
+    args = typing.get_args(t)
+    return not (len(args) == 2 and type(None) in args)
 
-    # For earlier versions
-    return typing.get_origin(t) is Union
 
+@lru_cache(maxsize=512)
+def _arg_names(args: Tuple) -> Tuple[str, ...]:
+    return tuple(x.__name__ for x in args)
 
-def get_module_constants_and_types(module: ModuleType) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    module_vars = {k: v for k, v in vars(module).items() if not k.startswith("__")}
+
+def union_arg_names(t: Any) -> List[str]:
+    """
+    Get the names of the member types of a union, in declaration order.
+
+        >>> union_arg_names(Union[int, str])
+        ['int', 'str']
+        >>> union_arg_names(Union[str, int])
+        ['str', 'int']
+
+    Note the cache is keyed on the argument tuple rather than the union itself,
+    as unions compare equal regardless of member order.
+
+    :param t: union type
+    :return: list of type names
+    """
+    args = typing.get_args(t)
+    try:
+        return list(_arg_names(args))
+    except TypeError:
+        # unhashable type arguments
+        return [x.__name__ for x in args]
+
+
+# values of these types are always constants, never type definitions
+SCALAR_CONSTANT_TYPES = (int, float, str, bytes, tuple)
+
+
+def get_module_constants_and_types(
+    module: ModuleType, module_vars: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    if module_vars is None:
+        module_vars = get_module_vars(module)
     constants = {}
     types: Dict[str, DefinedType] = {}
     for name, obj in module_vars.items():
-        if not inspect.isfunction(obj):
-            if inspect.isclass(obj):
+        if not isinstance(obj, FunctionType):
+            if obj is None or isinstance(obj, SCALAR_CONSTANT_TYPES):
+                # the bulk of module-level constants; no need to check for type aliases
+                constants[name] = obj
+            elif isinstance(obj, type):
                 t = obj.__name__
                 if t != name:
                     types[name] = t
             elif is_union(obj):
                 t = obj.__name__
                 if t != name:
-                    types[name] = [x.__name__ for x in typing.get_args(obj)]
+                    types[name] = union_arg_names(obj)  # type: ignore[assignment]
             elif isinstance(obj, NewType):
                 st = obj.__supertype__
                 if isinstance(st, type):
@@ -213,7 +350,9 @@ def get_module_constants_and_types(module: ModuleType) -> Tuple[Dict[str, Any],
     return constants, types
 
 
-def get_module_predicate_definitions(module: ModuleType) -> Dict[str, PredicateDefinition]:
+def get_module_predicate_definitions(
+    module: ModuleType, module_vars: Optional[Dict[str, Any]] = None
+) -> Dict[str, PredicateDefinition]:
     """
     Get all predicate classes defined in a module.
 
@@ -238,23 +377,16 @@ def get_module_predicate_definitions(module: ModuleType) -> Dict[str, PredicateD
         {'name': 'str', 'age': 'int'}
 
     :param module:
+    :param module_vars: variables of the module, if already computed
     :return:
     """
-    cls_name_map = get_module_predicate_classes(module)
-    pds = {}
-    parent_map = {}
-    cls_to_pd = {}
+    cls_name_map = get_module_predicate_classes(module, module_vars)
+    pds = {name: PredicateDefinition(name, introspect_attributes(cls)) for name, cls in cls_name_map.items()}
+    # predicate for each class; if a class is bound to several names, the last one is used
+    cls_to_predicate = {cls: name for name, cls in cls_name_map.items()}
+    # parents are resolved once all classes are registered, as a base may be bound to a name later in the module
     for name, cls in cls_name_map.items():
-        pd = PredicateDefinition(name, introspect_attributes(cls))
-        pds[name] = pd
-        # get python parent classes
-        parent_map[pd.predicate] = cls.__bases__
-        cls_to_pd[cls] = pd
-    for predicate, pd in pds.items():
-        pd.parents = []
-        for parent in parent_map[predicate]:
-            if parent in cls_to_pd:
-                pd.parents.append(cls_to_pd[parent].predicate)
+        pds[name].parents = [cls_to_predicate[parent] for parent in cls.__bases__ if parent in cls_to_predicate]
 
     return pds
 
@@ -1,7 +1,7 @@
 import ast
 import logging
 import operator
-from typing import Any, Callable, List, Mapping, Tuple, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from typedlogic import Implies, NegationAsFailure, Variable
 from typedlogic.datamodel import (
@@ -16,6 +16,7 @@ from typedlogic.datamodel import (
     SentenceGroup,
     Term,
 )
+from typedlogic.utils.type_dispatch import lookup_handler
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,22 @@ AST_OP_TO_FUN: Mapping[str, Callable] = {
     "NotIn": lambda x, y: x not in y,
 }
 
+# constructors for connectives written as calls, e.g. Implies(A, B)
+_CONNECTIVES: Dict[str, Callable[[Sentence, Sentence], Sentence]] = {
+    "Implies": Implies,
+    "Iff": Iff,
+    "Implied": Implied,
+}
+
+# quantifiers written as calls over a generator, e.g. all(... for x in gen(T))
+_QUANTIFIERS: Dict[str, Callable[[List[Variable], Sentence], Sentence]] = {
+    "all": Forall,
+    "any": Exists,
+}
+
+# predicate names for AST operator classes, as used in Terms
+_AST_OP_NAME: Dict[type, str] = {getattr(ast, k): f.__name__ for k, f in AST_OP_TO_FUN.items()}
+
 
 def parse_sentence(node: Union[ast.AST, List[ast.stmt]]) -> Sentence:
     """
@@ -72,151 +89,176 @@ def parse_sentence(node: Union[ast.AST, List[ast.stmt]]) -> Sentence:
     :type node: Union[ast.AST, List[ast.stmt]]
     :return: A Term instance
     """
-
-    def tr_arg_or_kw_value(v: ast.expr) -> Any:
-        if isinstance(v, ast.Constant):
-            return v.value
-        elif isinstance(v, ast.Name):
-            return Variable(v.id)
-        elif isinstance(v, (ast.BinOp, ast.UnaryOp, ast.Call)):
-            return parse_sentence(v)
-        else:
-            raise ValueError(f"Unsupported argument type: {type(v)} in {v}")
-
-    def parse_sentence_or_variable(v: ast.expr) -> Union[Sentence, Variable, Any]:
-        if isinstance(v, ast.Name):
-            return Variable(v.id)
-        elif isinstance(v, ast.Constant):
-            return v.value
-        else:
-            return parse_sentence(v)
-
     if isinstance(node, list):
         sentences = [parse_sentence(n) for n in node]
         if len(sentences) == 1:
             return sentences[0]
         else:
             return And(sentences)
-    if isinstance(node, ast.Expr):
-        return parse_sentence(node.value)
-    if isinstance(node, ast.Assert):
-        return parse_sentence(node.test)
-    if isinstance(node, ast.BinOp):
-        left = parse_sentence_or_variable(node.left)
-        right = parse_sentence_or_variable(node.right)
-        if isinstance(node.op, ast.RShift):
-            assert isinstance(left, Sentence)
-            assert isinstance(right, Sentence)
-            return left >> right
-        elif isinstance(node.op, ast.BitAnd):
-            assert isinstance(left, Sentence)
-            assert isinstance(right, Sentence)
-            return left & right
-        elif isinstance(node.op, ast.BitOr):
-            assert isinstance(left, Sentence)
-            assert isinstance(right, Sentence)
-            return left | right
-        elif isinstance(node.op, ast.BitXor):
-            assert isinstance(left, Sentence)
-            assert isinstance(right, Sentence)
-            return left ^ right
-        else:
-            return Term(AST_OP_TO_FUN[node.op.__class__.__name__].__name__, left, right)
-    elif isinstance(node, ast.BoolOp):
-        operands = [parse_sentence(value) for value in node.values]
-        if isinstance(node.op, ast.And):
-            return And(*operands)
-        elif isinstance(node.op, ast.Or):
-            return Or(*operands)
-        else:
-            raise ValueError(f"Unsupported boolean operator: {type(node.op)}")
-    elif isinstance(node, ast.UnaryOp):
-        if isinstance(node.op, ast.Invert):
-            return ~parse_sentence(node.operand)
-        elif isinstance(node.op, ast.Not):
-            return Not(parse_sentence(node.operand))
-        elif isinstance(node.op, ast.USub):
-            return NegationAsFailure(parse_sentence(node.operand))
-        else:
-            raise ValueError(f"Unsupported unary operator: {type(node.op)}")
-    elif isinstance(node, ast.If):
-        # if COND: BODY
-        test = node.test
-        body = node.body
-        orelse = node.orelse
-        if orelse:
-            raise ValueError("Else clause is not supported")
-        return parse_sentence(test) >> parse_sentence(body)
-    elif isinstance(node, ast.Call) and (
-        isinstance(node.func, ast.Name) and node.func.id in ["Implies", "Iff", "Implied"]
-    ):
-        if len(node.args) != 2:
-            raise ValueError(f"Unsupported number of arguments for {node.func.id}: {len(node.args)}")
-        left = parse_sentence(node.args[0])
-        right = parse_sentence(node.args[1])
-        if node.func.id == "Implies":
-            return Implies(left, right)
-        elif node.func.id == "Iff":
-            return Iff(left, right)
-        elif node.func.id == "Implied":
-            return Implied(left, right)
-        else:
+    handler = lookup_handler(_SENTENCE_DISPATCH, type(node))
+    if handler is None:
+        raise NotImplementedError(f"Unsupported node type: {type(node)}")
+    return handler(node)
+
+
+def _tr_arg_or_kw_value(v: ast.expr) -> Any:
+    if isinstance(v, ast.Constant):
+        return v.value
+    elif isinstance(v, ast.Name):
+        return Variable(v.id)
+    elif isinstance(v, (ast.BinOp, ast.UnaryOp, ast.Call)):
+        return parse_sentence(v)
+    else:
+        raise ValueError(f"Unsupported argument type: {type(v)} in {v}")
+
+
+def _parse_sentence_or_variable(v: ast.expr) -> Union[Sentence, Variable, Any]:
+    if isinstance(v, ast.Name):
+        return Variable(v.id)
+    elif isinstance(v, ast.Constant):
+        return v.value
+    else:
+        return parse_sentence(v)
+
+
+def _tr_keyword(kw: ast.keyword) -> Tuple[str, Any]:
+    if kw.arg is None:
+        raise ValueError("Positional arguments are not supported")
+    if isinstance(kw.value, ast.Constant):
+        v = kw.value.value
+    elif isinstance(kw.value, ast.Name):
+        v = Variable(kw.value.id)
+    elif isinstance(kw.value, (ast.BinOp, ast.UnaryOp, ast.Call)):
+        kw_val_ast = kw.value
+        if not isinstance(kw_val_ast, ast.AST):
             raise AssertionError
-    elif isinstance(node, ast.Call):
-        predicate = get_func_name(node.func)
-        if predicate in ["all", "any"]:
-            if len(node.args) != 1:
-                raise ValueError(f"Unsupported number of arguments for quantifier: {len(node.args)}")
-            arg0 = node.args[0]
-            if not isinstance(arg0, ast.GeneratorExp):
-                raise ValueError(f"Unsupported argument type for quantifier: {type(arg0)}")
-            args, sentence = parse_generator_node(arg0)
-            if predicate == "all":
-                return Forall(args, sentence)
-            else:
-                return Exists(args, sentence)
-
-        def tr_keyword(kw: ast.keyword) -> Tuple[str, Any]:
-            if kw.arg is None:
-                raise ValueError("Positional arguments are not supported")
-            if isinstance(kw.value, ast.Constant):
-                v = kw.value.value
-            elif isinstance(kw.value, ast.Name):
-                v = Variable(kw.value.id)
-            elif isinstance(kw.value, (ast.BinOp, ast.UnaryOp, ast.Call)):
-                kw_val_ast = kw.value
-                if not isinstance(kw_val_ast, ast.AST):
-                    raise AssertionError
-                v = parse_sentence(kw_val_ast)
-            else:
-                raise ValueError(f"Unsupported keyword value type: {type(kw.value)}")
-            return kw.arg, v
-
-        if node.keywords:
-            # keyword-based arguments are translated to a dict
-            bindings = dict([tr_keyword(kw) for kw in node.keywords])
-            return Term(predicate, bindings)
-        elif node.args:
-            # positional arguments are translated to a list
-            pos_args = [tr_arg_or_kw_value(arg) for arg in node.args]
-            return Term(predicate, *pos_args)
-        else:
-            return Term(predicate)
-            # return Term(predicate, {})
-    elif isinstance(node, ast.Compare):
-        left = tr_arg_or_kw_value(node.left)
-        if len(node.comparators) != 1:
-            raise ValueError(f"Unsupported number of comparators: {len(node.comparators)}")
-        right = tr_arg_or_kw_value(node.comparators[0])
-        if len(node.ops) != 1:
-            raise ValueError(f"Unsupported number of operators: {len(node.ops)}")
-        op = node.ops[0]
-        op_name = AST_OP_TO_FUN[op.__class__.__name__].__name__
-        return Term(op_name, left, right)
-    elif isinstance(node, ast.GeneratorExp):
-        raise ValueError("Generator expressions are not supported outside all/only")
+        v = parse_sentence(kw_val_ast)
     else:
-        raise NotImplementedError(f"Unsupported node type: {type(node)}")
+        raise ValueError(f"Unsupported keyword value type: {type(kw.value)}")
+    return kw.arg, v
+
+
+def _parse_expr(node: ast.Expr) -> Sentence:
+    return parse_sentence(node.value)
+
+
+def _parse_assert(node: ast.Assert) -> Sentence:
+    return parse_sentence(node.test)
+
+
+def _parse_binop(node: ast.BinOp) -> Sentence:
+    left = _parse_sentence_or_variable(node.left)
+    right = _parse_sentence_or_variable(node.right)
+    op_type = type(node.op)
+    if op_type is ast.RShift:
+        assert isinstance(left, Sentence)
+        assert isinstance(right, Sentence)
+        return left >> right
+    elif op_type is ast.BitAnd:
+        assert isinstance(left, Sentence)
+        assert isinstance(right, Sentence)
+        return left & right
+    elif op_type is ast.BitOr:
+        assert isinstance(left, Sentence)
+        assert isinstance(right, Sentence)
+        return left | right
+    elif op_type is ast.BitXor:
+        assert isinstance(left, Sentence)
+        assert isinstance(right, Sentence)
+        return left ^ right
+    else:
+        return Term(_AST_OP_NAME[op_type], left, right)
+
+
+def _parse_boolop(node: ast.BoolOp) -> Sentence:
+    operands = [parse_sentence(value) for value in node.values]
+    if isinstance(node.op, ast.And):
+        return And(*operands)
+    elif isinstance(node.op, ast.Or):
+        return Or(*operands)
+    else:
+        raise ValueError(f"Unsupported boolean operator: {type(node.op)}")
+
+
+def _parse_unaryop(node: ast.UnaryOp) -> Sentence:
+    if isinstance(node.op, ast.Invert):
+        return ~parse_sentence(node.operand)
+    elif isinstance(node.op, ast.Not):
+        return Not(parse_sentence(node.operand))
+    elif isinstance(node.op, ast.USub):
+        return NegationAsFailure(parse_sentence(node.operand))
+    else:
+        raise ValueError(f"Unsupported unary operator: {type(node.op)}")
+
+
+def _parse_if(node: ast.If) -> Sentence:
+    # if COND: BODY
+    test = node.test
+    body = node.body
+    orelse = node.orelse
+    if orelse:
+        raise ValueError("Else clause is not supported")
+    return parse_sentence(test) >> parse_sentence(body)
+
+
+def _parse_call(node: ast.Call) -> Sentence:
+    func = node.func
+    if type(func) is ast.Name:
+        connective = _CONNECTIVES.get(func.id)
+        if connective is not None:
+            if len(node.args) != 2:
+                raise ValueError(f"Unsupported number of arguments for {func.id}: {len(node.args)}")
+            return connective(parse_sentence(node.args[0]), parse_sentence(node.args[1]))
+    predicate = get_func_name(func)
+    quantifier = _QUANTIFIERS.get(predicate)
+    if quantifier is not None:
+        if len(node.args) != 1:
+            raise ValueError(f"Unsupported number of arguments for quantifier: {len(node.args)}")
+        arg0 = node.args[0]
+        if not isinstance(arg0, ast.GeneratorExp):
+            raise ValueError(f"Unsupported argument type for quantifier: {type(arg0)}")
+        args, sentence = parse_generator_node(arg0)
+        return quantifier(args, sentence)
+    if node.keywords:
+        # keyword-based arguments are translated to a dict
+        bindings = dict([_tr_keyword(kw) for kw in node.keywords])
+        return Term(predicate, bindings)
+    elif node.args:
+        # positional arguments are translated to a list
+        pos_args = [_tr_arg_or_kw_value(arg) for arg in node.args]
+        return Term(predicate, *pos_args)
+    else:
+        return Term(predicate)
+        # return Term(predicate, {})
+
+
+def _parse_compare(node: ast.Compare) -> Sentence:
+    left = _tr_arg_or_kw_value(node.left)
+    if len(node.comparators) != 1:
+        raise ValueError(f"Unsupported number of comparators: {len(node.comparators)}")
+    right = _tr_arg_or_kw_value(node.comparators[0])
+    if len(node.ops) != 1:
+        raise ValueError(f"Unsupported number of operators: {len(node.ops)}")
+    op_name = _AST_OP_NAME[type(node.ops[0])]
+    return Term(op_name, left, right)
+
+
+def _parse_generator_exp(node: ast.GeneratorExp) -> Sentence:
+    raise ValueError("Generator expressions are not supported outside all/only")
+
+
+# handlers for parse_sentence, keyed on AST node type; see lookup_handler
+_SENTENCE_DISPATCH: Dict[type, Optional[Callable]] = {
+    ast.Expr: _parse_expr,
+    ast.Assert: _parse_assert,
+    ast.BinOp: _parse_binop,
+    ast.BoolOp: _parse_boolop,
+    ast.UnaryOp: _parse_unaryop,
+    ast.If: _parse_if,
+    ast.Call: _parse_call,
+    ast.Compare: _parse_compare,
+    ast.GeneratorExp: _parse_generator_exp,
+}
 
 
 def parse_generator_node(node: ast.GeneratorExp) -> Tuple[List[Variable], Sentence]:
@@ -1,10 +1,12 @@
+import ast
 import logging
 import os
 import sys
 import tempfile
+from functools import lru_cache
 from io import TextIOWrapper
 from pathlib import Path
-from types import ModuleType
+from types import CodeType, ModuleType
 from typing import Iterator, Optional, TextIO, Tuple, Union
 
 from typedlogic import Theory
@@ -18,20 +20,46 @@ from typedlogic.parsers.pyparser.introspection import (
 logger = logging.getLogger(__name__)
 
 
-def compile_python(python_txt: str, name: Optional[str] = None, package_path: Optional[str] = None) -> ModuleType:
+@lru_cache(maxsize=64)
+def _parse_source(python_txt: str) -> ast.Module:
+    # the tree is shared between callers, and must not be modified
+    return ast.parse(python_txt)
+
+
+@lru_cache(maxsize=64)
+def _compile_source(python_txt: str, name: str) -> CodeType:
+    return compile(_parse_source(python_txt), name, "exec")
+
+
+def compile_python(
+    python_txt: Union[str, ast.Module], name: Optional[str] = None, package_path: Optional[str] = None
+) -> ModuleType:
     """
     Compile a Python module from a string
 
-    :param python_txt:
+    Code objects are cached on the source text, so recompiling the same source is cheap;
+    the module is always executed afresh.
+
+        >>> m1 = compile_python("X = 1", name="m")
+        >>> m2 = compile_python("X = 1", name="m")
+        >>> m1 is m2
+        False
+        >>> m2.X
+        1
+
+    :param python_txt: source text, or an already parsed module
     :param package_path:
     :return:
     """
     if name is None:
         if package_path:
-            name = os.path.basename(package_path).split(".")[0]
+            name = os.path.basename(package_path).partition(".")[0]
         else:
             name = "test"
-    spec = compile(python_txt, name, "exec")
+    if isinstance(python_txt, str):
+        spec = _compile_source(python_txt, name)
+    else:
+        spec = compile(python_txt, name, "exec")
     module = ModuleType(name)
     if package_path:
         package_path_abs = os.path.join(os.getcwd(), package_path)
@@ -96,8 +124,10 @@ class PythonParser(Parser):
             with source.open() as f:
                 return self.parse(f, file_name=str(source), **kwargs)
         if isinstance(source, str):
+            # parse once, for both compilation and sentence group extraction
+            module_ast = _parse_source(source)
             module = compile_python(source, name=None, package_path=file_name)
-            sgs = get_module_sentence_groups(source)
+            sgs = get_module_sentence_groups(module_ast)
             pds = get_module_predicate_definitions(module)
             # get the python module name
             return Theory(
@@ -1,3 +1,5 @@
+import copy
+from functools import lru_cache
 from io import TextIOWrapper
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TextIO, Union
@@ -8,6 +10,36 @@ from typedlogic import Theory
 from typedlogic.datamodel import Term, from_object
 from typedlogic.parser import Parser
 
+try:
+    # use the libyaml bindings where available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    # modification time and size are part of the key, so edited files are reloaded
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_yaml(source: Union[Path, str, TextIO]) -> Any:
+    """
+    Load a YAML document, reusing earlier loads of unchanged files.
+
+    The cached object is shared, so callers must not mutate it.
+
+    :param source: path, YAML text, or open file
+    :return: loaded object
+    """
+    if isinstance(source, Path):
+        st = source.stat()
+        return _load_yaml_file(str(source.resolve()), st.st_mtime_ns, st.st_size)
+    if not isinstance(source, (str, TextIOWrapper)):
+        raise ValueError(f"Invalid source type: {type(source)}")
+    return yaml.load(source, Loader=SafeLoader)
+
 
 class YAMLParser(Parser):
     """
@@ -15,11 +47,9 @@ class YAMLParser(Parser):
     """
 
     def parse(self, source: Union[Path, str, TextIO], **kwargs) -> Theory:
+        obj = _load_yaml(source)
         if isinstance(source, Path):
-            source = source.open()
-        if not isinstance(source, (str, TextIOWrapper)):
-            raise ValueError(f"Invalid source type: {type(source)}")
-        obj = yaml.safe_load(source)
+            obj = copy.deepcopy(obj)
         return from_object(obj)
 
     def parse_ground_terms(self, source: Union[Path, str, TextIO], **kwargs) -> List[Term]:
@@ -31,16 +61,14 @@ class YAMLParser(Parser):
         :return:
         """
         file_name = None
-        if isinstance(source, Path):
-            source = source.open()
+        if isinstance(source, (Path, str)):
             file_name = str(source)
-        if isinstance(source, str):
-            file_name = source
-        if not isinstance(source, (str, TextIOWrapper)):
-            raise ValueError(f"Invalid source type: {type(source)}")
-        obj = yaml.safe_load(source)
+        obj = _load_yaml(source)
+        if isinstance(source, Path):
+            # terms keep references to the loaded mappings, which must not alias the cache
+            obj = copy.deepcopy(obj)
         if file_name:
-            default_predicate = Path(file_name).stem.split(".")[0]
+            default_predicate = Path(file_name).stem.partition(".")[0]
         else:
             default_predicate = None
         if isinstance(obj, list):
@@ -56,8 +84,9 @@ class YAMLParser(Parser):
     def _ground_term(self, obj: Union[Dict[str, Any], List[Any]], default_predicate: Optional[str] = None) -> Term:
         if isinstance(obj, dict):
             if "@type" in obj:
+                # copy rather than delete, as the loaded object may be cached
                 default_predicate = obj["@type"]
-                del obj["@type"]
+                obj = {k: v for k, v in obj.items() if k != "@type"}
             if not default_predicate:
                 raise ValueError("No predicate found")
             return Term(default_predicate, obj)
@@ -276,8 +276,12 @@ class Solver(ABC):
                 self.add_sentence(sentence)
 
     def add_sentence(self, sentence: Sentence) -> None:
-        if sentence not in self.base_theory.sentences:
-            self.base_theory.sentence_groups.append(SentenceGroup(name="dynamic", sentences=[sentence]))
+        sentence_groups = self.base_theory.sentence_groups
+        # search the most recent groups first: add_sentence_group appends the group before adding its sentences
+        for sg in reversed(sentence_groups):
+            if sg.sentences and sentence in sg.sentences:
+                return
+        sentence_groups.append(SentenceGroup(name="dynamic", sentences=[sentence]))
 
     def add_predicate_definition(self, predicate_definition: PredicateDefinition) -> None:
         """
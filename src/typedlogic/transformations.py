@@ -1528,6 +1528,9 @@ def force_stratification(horn_rules: List[Sentence]) -> List[Sentence]:
                 pmap[pred].append((term.predicate, negated))
                 if negated:
                     edge_to_rules[(pred, term.predicate)].append(i)
+    if not edge_to_rules:
+        # a program without negation in rule bodies is trivially stratified
+        return horn_rules
     is_stratified, edge, _ = analyze_datalog_program(list(pmap.items()))
     if not is_stratified:
         if not edge:
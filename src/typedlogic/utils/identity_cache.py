@@ -0,0 +1,80 @@
+"""
+Caching for unhashable objects, such as sentences.
+"""
+import weakref
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class IdentityCache(Generic[V]):
+    """
+    A cache keyed on object identity.
+
+    This is intended for objects such as sentences, which are not hashable, and which are
+    treated as immutable once constructed.
+
+        >>> from typedlogic import And, Term
+        >>> cache = IdentityCache()
+        >>> s = And(Term("P"), Term("Q"))
+        >>> cache.get(s) is None
+        True
+        >>> cache.set(s, "p, q")
+        >>> cache.get(s)
+        'p, q'
+
+    An equal but distinct object is a different key:
+
+        >>> cache.get(And(Term("P"), Term("Q"))) is None
+        True
+
+    Entries are dropped when the key object is garbage collected:
+
+        >>> del s
+        >>> len(cache)
+        0
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty cache.
+        """
+        self._entries: Dict[int, Tuple[weakref.ref, V]] = {}
+
+    def __len__(self) -> int:
+        """
+        Number of entries in the cache.
+        """
+        return len(self._entries)
+
+    def get(self, obj: Any) -> Optional[V]:
+        """
+        Get the cached value for an object.
+
+        :param obj: key object
+        :return: cached value, or None if there is no entry for this object
+        """
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return None
+
+    def set(self, obj: Any, value: V) -> None:
+        """
+        Cache a value for an object.
+
+        The object must support weak references.
+
+        :param obj: key object
+        :param value: value to cache
+        """
+        key = id(obj)
+        entries = self._entries
+        entries[key] = (weakref.ref(obj, lambda _: entries.pop(key, None)), value)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._entries.clear()
@@ -1,27 +1,37 @@
-from typing import List
+from typing import Iterable, List
 
 from typedlogic import PredicateDefinition, Term
 from typedlogic.datamodels.typesystem import get_python_type
 
 
-def make_terms(rows: List[List[str]], pd: PredicateDefinition) -> List[Term]:
+def make_terms(rows: Iterable[List[str]], pd: PredicateDefinition) -> List[Term]:
     """
-    Make terms from a list of rows
+    Make terms from rows of values, coercing each value to the python type of its argument
+
+        >>> pd = PredicateDefinition("Age", {"name": "str", "age": "int"})
+        >>> make_terms(iter([["a", "1"], ["b", "2"]]), pd)
+        [Age(a, 1), Age(b, 2)]
+
+    :param rows: any iterable of rows; consumed once
+    :param pd: predicate definition
+    :return: list of terms
     """
-    terms = []
+    converters = []
     for i, pd_arg in enumerate(pd.arguments.values()):
         py_type = get_python_type(pd_arg)
         if not py_type:
             continue
         if py_type == str:
             continue
-        for j, row in enumerate(rows):
-            rows[j][i] = py_type(row[i])
+        converters.append((i, py_type))
     pred = pd.predicate
+    terms = []
     for row in rows:
         if not pd.arguments:
             terms.append(Term(pred))
         else:
+            for i, py_type in converters:
+                row[i] = py_type(row[i])
             # TODO: coerce ints
             terms.append(Term(pred, *row))
     return terms
@@ -0,0 +1,31 @@
+"""Dispatch on the type of an object via a lookup table."""
+from typing import Callable, Dict, Optional
+
+
+def lookup_handler(table: Dict[type, Optional[Callable]], typ: type) -> Optional[Callable]:
+    """
+    Look up the handler for a type in a dispatch table.
+
+    Types not in the table (e.g. subclasses) are resolved once via their MRO,
+    and the result is stored back in the table.
+
+        >>> class A: pass
+        >>> class B(A): pass
+        >>> table = {A: len}
+        >>> lookup_handler(table, B) is len
+        True
+        >>> B in table
+        True
+        >>> lookup_handler(table, int) is None
+        True
+
+    :param table: dispatch table
+    :param typ: type of the object to dispatch on
+    :return: handler, or None if there is no handler for the type
+    """
+    try:
+        return table[typ]
+    except KeyError:
+        handler = next((table[c] for c in typ.__mro__ if c in table), None)
+        table[typ] = handler
+        return handler
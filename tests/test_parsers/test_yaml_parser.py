@@ -21,3 +21,16 @@ def test_parse_data(parser, data_path, expected):
     terms = parser.parse_ground_terms(data_path)
     terms_flat = [str(t) for t in terms]
     assert terms_flat == expected
+
+
+def test_parse_data_repeated(parser, tmp_path):
+    data_path = tmp_path / "Link.yaml"
+    data_path.write_text("- {'@type': Link, source: a, target: b}\n")
+    assert [str(t) for t in parser.parse_ground_terms(data_path)] == ["Link(a, b)"]
+    assert [str(t) for t in parser.parse_ground_terms(data_path)] == ["Link(a, b)"]
+    data_path.write_text("- {'@type': Link, source: a, target: c}\n- [b, c]\n")
+    assert [str(t) for t in parser.parse_ground_terms(data_path)] == ["Link(a, c)", "Link(b, c)"]
+    # mutating a returned term must not affect later parses
+    data_path.write_text("- {source: a, target: d}\n")
+    parser.parse_ground_terms(data_path)[0].bindings["target"] = "z"
+    assert [str(t) for t in YAMLParser().parse_ground_terms(data_path)] == ["Link(a, d)"]
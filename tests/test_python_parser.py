@@ -1,9 +1,14 @@
 import ast
+import os
+from pathlib import Path
 
 import pytest
 from typedlogic import And, Implies, Not, Or, Variable
 from typedlogic.datamodel import Exists, Forall, Iff, Term
 from typedlogic.parsers.pyparser.python_ast_utils import parse_function_def_to_sentence_group, parse_sentence
+from typedlogic.parsers.pyparser.python_parser import PythonParser, _compile_source
+
+from tests import TEST_THEOREMS_DIR
 
 X = Variable("x")
 Y = Variable("y")
@@ -247,3 +252,48 @@ def test_unsupported_node_type():
     func_def = tree.body[0]
     with pytest.raises(NotImplementedError, match="Unsupported node type"):
         parse_function_def_to_sentence_group(func_def)
+
+
+def test_parse_to_sentences_reuses_parse():
+    parser = PythonParser()
+    path = TEST_THEOREMS_DIR / "mortals.py"
+    sentences = parser.parse_to_sentences(path)
+    assert sentences
+    assert parser.parse_to_sentences(path) == sentences
+    parser.parse_ground_terms(path)
+    assert len(parser._parse_cache) == 1
+    # the cache is internal state, not part of the parser's identity
+    assert parser == PythonParser()
+    assert repr(parser) == repr(PythonParser())
+
+
+def test_parse_reuses_compiled_source():
+    parser = PythonParser()
+    source = (TEST_THEOREMS_DIR / "mortals.py").read_text()
+    theory = parser.parse(source)
+    hits = _compile_source.cache_info().hits
+    theory2 = parser.parse(source)
+    assert _compile_source.cache_info().hits == hits + 1
+    assert theory2.sentences == theory.sentences
+
+
+def test_parse_cache_keys_on_resolved_path(tmp_path, monkeypatch):
+    for subdir, predicate in [("a", "P"), ("b", "Q")]:
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / "theory.py").write_text(
+            "from dataclasses import dataclass\n"
+            "from typedlogic import FactMixin, axiom\n\n"
+            "@dataclass\n"
+            f"class {predicate}(FactMixin):\n"
+            "    x: str\n\n"
+            "@axiom\n"
+            "def f(x: str):\n"
+            f"    assert {predicate}(x)\n"
+        )
+        # same modification time, so only the directory tells the files apart
+        os.utime(tmp_path / subdir / "theory.py", ns=(0, 0))
+    parser = PythonParser()
+    monkeypatch.chdir(tmp_path / "a")
+    assert [str(s) for s in parser.parse_to_sentences(Path("theory.py"))] == ["∀x: str : P(?x)"]
+    monkeypatch.chdir(tmp_path / "b")
+    assert [str(s) for s in parser.parse_to_sentences(Path("theory.py"))] == ["∀x: str : Q(?x)"]